@@ -18,13 +18,18 @@ class TKN57UtilitiesMenu(bpy.types.Menu):
     def draw(self, context):
         layout = self.layout
         layout.operator("wm.blender_export_shape_keys", text="Export Shape Keys as OBJs")
+        layout.operator("import_shape_keys.folder", text="Import Shape Keys from OBJs")
         layout.operator("export.selected_bone_transforms_txt")
         layout.operator("export_weights.default", text="Export Bone Weights")
         layout.operator("export_weights.john_cena", text="Export Bone Weights (John Cena Base")
         layout.operator("export_weights.steve_austin", text="Export Bone Weights (Steve Austin Base")
         layout.operator("export_weights.charlotte_flair", text="Export Bone Weights (Charlotte Flair Base")
         layout.operator("export_weights_all.folder", text="Export Bone Weights (All Bones)")
+        layout.operator("export_weights.multi_rig", text="Export Bone Weights (Multiple Rigs)")
+        layout.operator("export_weights.detect_base_rig", text="Detect Base Rig")
+        layout.operator("import_weights.folder", text="Import Bone Weights")
         layout.operator("export.wavefront_normals_dialog")
+        layout.operator("export.wavefront_normals_live")
         layout.operator("object.remove_modifiers_weights")
         layout.operator("object.rename_bones_from_text_fallback")
         layout.operator("object.tekken57_rig_meshes")
@@ -41,9 +46,16 @@ class ExportWavefrontNormalsDialog(bpy.types.Operator):
     bl_idname = "export.wavefront_normals_dialog"
     bl_label = "Export Wavefront Normals"
     rotate_model: bpy.props.BoolProperty(name="Rotate Model", default=True)
+    split_vertices: bpy.props.BoolProperty(name="Split Seams", default=False)
+    write_binary: bpy.props.BoolProperty(name="Binary Dump", default=False)
+    use_parallel: bpy.props.BoolProperty(name="Parallel Export", default=False)
+    live_update: bpy.props.BoolProperty(name="Live Update", default=False)
 
     def execute(self, context):
-        bpy.ops.export.wavefront_normals('INVOKE_DEFAULT', rotate_model=int(self.rotate_model))
+        bpy.ops.export.wavefront_normals('INVOKE_DEFAULT', rotate_model=int(self.rotate_model),
+                                         split_vertices=self.split_vertices, write_binary=self.write_binary,
+                                         use_parallel=self.use_parallel,
+                                         live_update=self.live_update)
         return {'FINISHED'}
 
     def invoke(self, context, event):
@@ -72,14 +84,18 @@ classes = (
 def register():
     # Import and register modules
     from . import blender_export_shape_keys
-    from . import export_shape_keys_to_obj
+    from . import import_shape_keys
     from . import export_bone_data
     from . import export_bone_weights_tkn57
     from . import export_bone_weights_john_cena
     from . import export_bone_weights_steve_austin
     from . import export_bone_weights_charlotte_flair
     from . import export_bone_weights_tkn57_all_bones
+    from . import export_bone_weights_multi_rig
+    from . import detect_base_rig
+    from . import import_bone_weights
     from . import export_wavefront_batch_2k22_tkn57
+    from . import wavefront_normals_live
     from . import remove_modifiers_and_weights_tkn57
     from . import rename_bones
     from . import tekken57_rig_meshes_2k22
@@ -88,14 +104,18 @@ def register():
     #from . import export_00ce_mask  # ✅ NEW
 
     blender_export_shape_keys.register()
-    export_shape_keys_to_obj.register()
+    import_shape_keys.register()
     export_bone_data.register()
     export_bone_weights_tkn57.register()
     export_bone_weights_john_cena.register()
     export_bone_weights_steve_austin.register()
     export_bone_weights_charlotte_flair.register()
     export_bone_weights_tkn57_all_bones.register()
+    export_bone_weights_multi_rig.register()
+    detect_base_rig.register()
+    import_bone_weights.register()
     export_wavefront_batch_2k22_tkn57.register()
+    wavefront_normals_live.register()
     remove_modifiers_and_weights_tkn57.register()
     rename_bones.register()
     tekken57_rig_meshes_2k22.register()
@@ -115,14 +135,18 @@ def unregister():
         bpy.utils.unregister_class(cls)
 
     from . import blender_export_shape_keys
-    from . import export_shape_keys_to_obj
+    from . import import_shape_keys
     from . import export_bone_data
     from . import export_bone_weights_tkn57
     from . import export_bone_weights_john_cena
     from . import export_bone_weights_steve_austin
     from . import export_bone_weights_charlotte_flair
     from . import export_bone_weights_tkn57_all_bones
+    from . import export_bone_weights_multi_rig
+    from . import detect_base_rig
+    from . import import_bone_weights
     from . import export_wavefront_batch_2k22_tkn57
+    from . import wavefront_normals_live
     from . import remove_modifiers_and_weights_tkn57
     from . import rename_bones
     from . import tekken57_rig_meshes_2k22
@@ -131,14 +155,18 @@ def unregister():
     #from . import export_00ce_mask  # ✅ NEW
 
     blender_export_shape_keys.unregister()
-    export_shape_keys_to_obj.unregister()
+    import_shape_keys.unregister()
     export_bone_data.unregister()
     export_bone_weights_tkn57.unregister()
     export_bone_weights_john_cena.unregister()
     export_bone_weights_steve_austin.unregister()
     export_bone_weights_charlotte_flair.unregister()
     export_bone_weights_tkn57_all_bones.unregister()
+    export_bone_weights_multi_rig.unregister()
+    detect_base_rig.unregister()
+    import_bone_weights.unregister()
     export_wavefront_batch_2k22_tkn57.unregister()
+    wavefront_normals_live.unregister()
     remove_modifiers_and_weights_tkn57.unregister()
     rename_bones.unregister()
     tekken57_rig_meshes_2k22.unregister()
@@ -146,5 +174,8 @@ def unregister():
     import_obj_preserve_order.unregister()
     #export_00ce_mask.unregister()  # ✅ NEW
 
+    from . import weight_table
+    weight_table.clear_lookup_cache()
+
 if __name__ == "__main__":
     register()
@@ -1,34 +1,98 @@
 import bpy
-from bpy_extras.io_utils import ExportHelper
 import os
+import re
+from bpy.props import BoolProperty, EnumProperty, FloatProperty, StringProperty
+from bpy_extras.io_utils import ImportHelper
+from . import shape_key_files
 
-class ExportShapeKeysOperator(bpy.types.Operator, ExportHelper):
+RELATIVE_KEY = '__RELATIVE__'
+
+# Blender only keeps pointers to the strings of dynamic enum items, so the
+# list has to outlive the callback
+_reference_items = []
+
+def reference_key_items(self, context):
+    _reference_items[:] = [(RELATIVE_KEY, "Relative Key", "Measure each key from its own relative key")]
+    obj = context.object
+    if obj and obj.type == 'MESH' and obj.data.shape_keys:
+        _reference_items.extend((key_block.name, key_block.name, "") for key_block in obj.data.shape_keys.key_blocks)
+    return _reference_items
+
+class ExportShapeKeysOperator(bpy.types.Operator, ImportHelper):
+    """Export the shape keys of the active object as individual OBJ files, built from the shape key data. Modifiers (Armature, Mirror, ...) are not applied, so the geometry and vertex count can differ from an export of the evaluated mesh"""
     bl_idname = "wm.blender_export_shape_keys"
     bl_label = "Export Shape Keys as OBJs"
     filename_ext = ""
     use_filter_folder = True
+    directory: StringProperty(name="Export Directory", subtype='DIR_PATH')
+
+    name_filter: StringProperty(
+        name="Name Filter",
+        description="Only export keys whose name matches this wildcard pattern (e.g. viseme_*); empty exports all",
+        default=""
+    )
+
+    use_regex: BoolProperty(
+        name="Regular Expression",
+        description="Treat the name filter as a regular expression searched in each key name",
+        default=False
+    )
+
+    skip_muted: BoolProperty(
+        name="Skip Muted Keys",
+        description="Leave out keys that are muted in the shape key list (otherwise they are written with the Basis shape, as they evaluate)",
+        default=True
+    )
+
+    reference_key: EnumProperty(
+        name="Reference Key",
+        description="Key the exported shapes are measured from, added on top of the Basis",
+        items=reference_key_items
+    )
+
+    sparse_deltas: BoolProperty(
+        name="Sparse Deltas",
+        description="Write all keys into one <object>_deltas.bin holding only the vertices each key moves, instead of one OBJ per key",
+        default=False
+    )
+
+    delta_epsilon: FloatProperty(
+        name="Delta Threshold",
+        description="Vertices that a key moves by no more than this distance are left out of the delta file",
+        default=1e-5,
+        min=0.0,
+        precision=6
+    )
 
     def execute(self, context):
-        export_path = self.filepath
         obj = context.object
 
-        if obj.type != 'MESH' or not obj.data.shape_keys:
+        if not obj or obj.type != 'MESH' or not obj.data.shape_keys:
             self.report({'ERROR'}, "Select a mesh object with shape keys.")
             return {'CANCELLED'}
 
-        # Reset all shape keys to 0 (skipping Basis)
-        for skblock in obj.data.shape_keys.key_blocks[1:]:
-            skblock.value = 0
+        if not obj.data.shape_keys.use_relative:
+            self.report({'ERROR'}, f"{obj.name} uses absolute shape keys; only relative shape keys can be exported per key.")
+            return {'CANCELLED'}
+
+        export_path = self.directory
+        key_blocks = obj.data.shape_keys.key_blocks
+        try:
+            keys = shape_key_files.select_keys(key_blocks, self.name_filter, self.use_regex, self.skip_muted)
+        except re.error as e:
+            self.report({'ERROR'}, f"Invalid name filter: {e}")
+            return {'CANCELLED'}
+        if not keys:
+            self.report({'WARNING'}, "No shape keys match the filter.")
+            return {'CANCELLED'}
 
-        # Iterate and export shape keys
-        for skblock in obj.data.shape_keys.key_blocks[1:]:
-            skblock.value = 1.0
-            obj_name = skblock.name + ".obj"
-            file_path = os.path.join(export_path, obj_name)
-            bpy.ops.export_scene.obj(filepath=file_path, keep_vertex_order=True, use_uvs=False, use_normals=False, use_selection=True)
-            skblock.value = 0
+        reference = None if self.reference_key in ('', RELATIVE_KEY) else self.reference_key
+        if self.sparse_deltas:
+            shape_key_files.export_shape_key_deltas(obj, export_path, self.delta_epsilon, keys, reference)
+        else:
+            shape_key_files.export_shape_keys(obj, export_path, keys, reference, max_workers=os.cpu_count())
 
-        self.report({'INFO'}, f"Shape keys exported successfully to: {export_path}")
+        self.report({'INFO'}, f"{len(keys)} shape keys exported to: {export_path}")
         return {'FINISHED'}
 
 def register():
@@ -0,0 +1,47 @@
+import bpy
+from collections import Counter
+from . import rig_maps
+from . import weight_table
+
+class DetectBaseRigOperator(bpy.types.Operator):
+    """Score each base rig's bone map against the weights of the selected meshes"""
+    bl_idname = "export_weights.detect_base_rig"
+    bl_label = "Detect Base Rig"
+
+    def execute(self, context):
+        selected_meshes = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        if not selected_meshes:
+            self.report({'WARNING'}, "No mesh objects selected.")
+            return {'CANCELLED'}
+
+        group_totals = Counter()
+        for obj in selected_meshes:
+            group_totals.update(weight_table.group_weight_totals(obj))
+
+        if not any(group_totals.values()):
+            self.report({'WARNING'}, "Selected meshes have no vertex group weights.")
+            return {'CANCELLED'}
+
+        scores = []
+        for _identifier, label, _folder, bone_map in rig_maps.RIGS:
+            dropped_share, dropped_groups = weight_table.score_bone_map(group_totals, bone_map)
+            scores.append((dropped_share, len(dropped_groups), label, dropped_groups))
+        scores.sort()
+
+        for dropped_share, _count, label, dropped_groups in reversed(scores):
+            message = f"{label}: {100.0 * (1.0 - dropped_share):.2f}% of weight covered, {100.0 * dropped_share:.2f}% dropped"
+            if dropped_groups:
+                message += f" ({len(dropped_groups)} groups: {', '.join(dropped_groups[:8])}{', ...' if len(dropped_groups) > 8 else ''})"
+            self.report({'INFO'}, message)
+
+        self.report({'INFO'}, f"Best match: {scores[0][2]}")
+        return {'FINISHED'}
+
+def register():
+    bpy.utils.register_class(DetectBaseRigOperator)
+
+def unregister():
+    bpy.utils.unregister_class(DetectBaseRigOperator)
+
+if __name__ == "__main__":
+    register()
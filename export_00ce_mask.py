@@ -4,6 +4,7 @@ import struct
 from bpy_extras.io_utils import ExportHelper
 from bpy.types import Operator
 from bpy.props import StringProperty
+from . import mask_faces
 
 class Export00CEMaskOperator(Operator, ExportHelper):
     """Export selected face masks to 00CE.pac binary format"""
@@ -19,9 +20,21 @@ class Export00CEMaskOperator(Operator, ExportHelper):
     def execute(self, context):
         return self.export_00ce_mask_file(context)
 
+    def load_face_index(self, obj_name, original_obj_path):
+        if not os.path.isfile(original_obj_path):
+            self.report({'WARNING'}, f"Original OBJ not found for {obj_name}. Expected at: {original_obj_path}")
+            return None
+
+        # Index the OBJ's faces by sorted vertex tuple
+        face_index = mask_faces.build_face_index(mask_faces.load_obj_faces(original_obj_path))
+        if face_index.duplicates:
+            self.report({'WARNING'}, f"{obj_name}.obj: {mask_faces.describe_duplicates(face_index.duplicates)}")
+        return face_index
+
     def export_00ce_mask_file(self, context):
         object_data = []
         save_dir = os.path.dirname(self.filepath)
+        mask_faces.sync_edit_mode(context.selected_objects)
 
         for obj in context.selected_objects:
             if obj.type != 'MESH':
@@ -35,36 +48,15 @@ class Export00CEMaskOperator(Operator, ExportHelper):
                 continue
 
             container_name = "M_Head" if index == 0 else "M_Body"
+
             original_obj_path = os.path.join(save_dir, f"{obj_name}.obj")
-            if not os.path.isfile(original_obj_path):
-                self.report({'WARNING'}, f"Original OBJ not found for {obj_name}. Expected at: {original_obj_path}")
+            mapped = mask_faces.selected_obj_positions(obj.data, lambda: self.load_face_index(obj_name, original_obj_path))
+            if mapped is None:
                 continue
-
-            # Parse face list from OBJ file
-            with open(original_obj_path, 'r') as f:
-                original_faces = []
-                for line in f:
-                    if line.startswith("f "):
-                        parts = line.strip().split()[1:]
-                        verts = [int(p.split('/')[0]) for p in parts]
-                        if len(verts) == 3:
-                            original_faces.append(tuple(sorted(verts)))
-
-            # Get selected faces from Blender object
-            bpy.context.view_layer.objects.active = obj
-            bpy.ops.object.mode_set(mode='EDIT')
-            bpy.ops.mesh.select_mode(type="FACE")
-            bpy.ops.object.mode_set(mode='OBJECT')
-
-            selected_faces = []
-            for face in obj.data.polygons:
-                if face.select:
-                    verts = [obj.data.loops[i].vertex_index + 1 for i in range(face.loop_start, face.loop_start + face.loop_total)]
-                    try:
-                        idx = original_faces.index(tuple(sorted(verts)))
-                        selected_faces.append(idx)
-                    except ValueError:
-                        print(f"Face {verts} not found in {obj_name}")
+            positions, missing = mapped
+            if missing:
+                print(f"{missing} selected faces not found in {obj_name}")
+            selected_faces = positions.tolist()
 
             if not selected_faces:
                 continue
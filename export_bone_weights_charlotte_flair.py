@@ -1,8 +1,8 @@
 import bpy
-import os
 import bpy.types
 from bpy_extras.io_utils import ImportHelper
 from bpy.props import StringProperty
+from .weight_export import WeightExportOptions, export_weight_files
 
 # Bone name to ID map from 3ds Max
 bone_name_to_max_id = {
@@ -408,7 +408,7 @@ bone_name_to_max_id = {
     "J_Tongue4": 399
 }
 
-class ExportCharlotteWeights(bpy.types.Operator, ImportHelper):
+class ExportCharlotteWeights(bpy.types.Operator, ImportHelper, WeightExportOptions):
     """Export Charlotte Flair Bone Weights"""
     bl_idname = "export_weights.charlotte_flair"
     bl_label = "Export Bone Weights (Charlotte Flair Base)"
@@ -424,21 +424,7 @@ class ExportCharlotteWeights(bpy.types.Operator, ImportHelper):
             self.report({'WARNING'}, "No mesh objects selected.")
             return {'CANCELLED'}
 
-        for idx, obj in enumerate(selected_meshes):
-            txt_path = os.path.join(self.directory, f"Object{idx}.txt")
-            try:
-                with open(txt_path, 'w') as out:
-                    for v in obj.data.vertices:
-                        weights = []
-                        for g in v.groups:
-                            vg = obj.vertex_groups[g.group]
-                            bone_id = bone_name_to_max_id.get(vg.name)
-                            if bone_id is not None:
-                                weights.append(f"{bone_id} {g.weight:.6f}")
-                        out.write(" ".join(weights) + "\n")
-            except Exception as e:
-                self.report({'ERROR'}, f"Failed to export {obj.name}: {e}")
-                continue
+        export_weight_files(self, selected_meshes, self.directory, bone_name_to_max_id)
 
         self.report({'INFO'}, f"Weights exported to: {self.directory}")
         return {'FINISHED'}
@@ -1,7 +1,7 @@
 import bpy
-import os
 from bpy_extras.io_utils import ImportHelper
 from bpy.props import StringProperty
+from .weight_export import WeightExportOptions, export_weight_files
 
 # Bone name to ID map from 3ds Max (John Cena Base)
 bone_name_to_max_id = {
@@ -427,7 +427,7 @@ bone_name_to_max_id = {
     "J_Tongue4": 419
 }
 
-class ExportWeightsCena(bpy.types.Operator, ImportHelper):
+class ExportWeightsCena(bpy.types.Operator, ImportHelper, WeightExportOptions):
     bl_idname = "export_weights.john_cena"
     bl_label = "Export Bone Weights (John Cena Base)"
     filename_ext = ""
@@ -440,21 +440,7 @@ class ExportWeightsCena(bpy.types.Operator, ImportHelper):
             self.report({'WARNING'}, "No mesh objects selected.")
             return {'CANCELLED'}
 
-        for idx, obj in enumerate(selected_meshes):
-            path = os.path.join(self.directory, f"Object{idx}.txt")
-            try:
-                with open(path, 'w') as f:
-                    for v in obj.data.vertices:
-                        weights = []
-                        for g in v.groups:
-                            vg = obj.vertex_groups[g.group]
-                            bone_id = bone_name_to_max_id.get(vg.name)
-                            if bone_id is not None:
-                                weights.append(f"{bone_id} {g.weight:.6f}")
-                        f.write(" ".join(weights) + "\n")
-            except Exception as e:
-                self.report({'ERROR'}, f"Export failed for {obj.name}: {e}")
-                continue
+        export_weight_files(self, selected_meshes, self.directory, bone_name_to_max_id)
 
         self.report({'INFO'}, f"Export complete to: {self.directory}")
         return {'FINISHED'}
@@ -0,0 +1,53 @@
+import bpy
+import os
+from bpy_extras.io_utils import ImportHelper
+from bpy.props import EnumProperty, StringProperty
+from . import rig_maps
+from .weight_export import WeightExportOptions, export_rig_weight_files
+
+class ExportWeightsMultiRig(bpy.types.Operator, ImportHelper, WeightExportOptions):
+    """Export bone weights for several base rigs in one pass, one subfolder per rig"""
+    bl_idname = "export_weights.multi_rig"
+    bl_label = "Export Bone Weights (Multiple Rigs)"
+    filename_ext = ""
+    use_filter_folder = True
+    directory: StringProperty(subtype='DIR_PATH')
+
+    rigs: EnumProperty(
+        name="Rigs",
+        description="Base rigs to export weights for",
+        items=rig_maps.RIG_ITEMS,
+        options={'ENUM_FLAG'},
+        default={'TKN57', 'JOHN_CENA', 'STEVE_AUSTIN', 'CHARLOTTE_FLAIR'},
+    )
+
+    def execute(self, context):
+        selected_meshes = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        if not selected_meshes:
+            self.report({'WARNING'}, "No mesh objects selected.")
+            return {'CANCELLED'}
+
+        if not self.rigs:
+            self.report({'WARNING'}, "No rigs chosen.")
+            return {'CANCELLED'}
+
+        targets = []
+        for identifier, _label, folder, bone_map in rig_maps.RIGS:
+            if identifier in self.rigs:
+                export_dir = os.path.join(self.directory, folder)
+                os.makedirs(export_dir, exist_ok=True)
+                targets.append((export_dir, bone_map))
+
+        export_rig_weight_files(self, selected_meshes, targets)
+
+        self.report({'INFO'}, f"Weights for {len(targets)} rigs exported to: {self.directory}")
+        return {'FINISHED'}
+
+def register():
+    bpy.utils.register_class(ExportWeightsMultiRig)
+
+def unregister():
+    bpy.utils.unregister_class(ExportWeightsMultiRig)
+
+if __name__ == "__main__":
+    register()
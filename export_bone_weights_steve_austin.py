@@ -1,7 +1,7 @@
 import bpy
-import os
 from bpy_extras.io_utils import ImportHelper
 from bpy.props import StringProperty
+from .weight_export import WeightExportOptions, export_weight_files
 
 # Bone name to ID map from 3ds Max (abbreviated for clarity)
 bone_name_to_max_id = {
@@ -440,7 +440,7 @@ bone_name_to_max_id = {
 }
 
 
-class ExportWeightsSteveAustin(bpy.types.Operator, ImportHelper):
+class ExportWeightsSteveAustin(bpy.types.Operator, ImportHelper, WeightExportOptions):
     bl_idname = "export_weights.steve_austin"
     bl_label = "Export Bone Weights (Steve Austin)"
     filename_ext = ""
@@ -455,21 +455,7 @@ class ExportWeightsSteveAustin(bpy.types.Operator, ImportHelper):
             self.report({'WARNING'}, "No mesh objects selected.")
             return {'CANCELLED'}
 
-        for idx, obj in enumerate(selected_meshes):
-            txt_path = os.path.join(self.directory, f"Object{idx}.txt")
-            try:
-                with open(txt_path, 'w') as out:
-                    for v in obj.data.vertices:
-                        weights = []
-                        for g in v.groups:
-                            vg = obj.vertex_groups[g.group]
-                            bone_id = bone_name_to_max_id.get(vg.name)
-                            if bone_id is not None:
-                                weights.append(f"{bone_id} {g.weight:.6f}")
-                        out.write(" ".join(weights) + "\n")
-            except Exception as e:
-                self.report({'ERROR'}, f"Failed to export {obj.name}: {e}")
-                continue
+        export_weight_files(self, selected_meshes, self.directory, bone_name_to_max_id)
 
         self.report({'INFO'}, f"Weights exported to: {self.directory}")
         return {'FINISHED'}
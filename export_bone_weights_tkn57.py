@@ -4,6 +4,7 @@ from bpy.props import StringProperty
 from bpy.types import Operator
 from bpy_extras.io_utils import ImportHelper
 from bpy_extras.io_utils import ExportHelper
+from .weight_export import WeightExportOptions, export_weight_files
 
 # Bone name to ID map from 3ds Max
 bone_name_to_max_id = {
@@ -25,7 +26,7 @@ bone_name_to_max_id = {
     "J_Tongue1": 64, "J_Tongue2": 65, "J_Tongue3": 66, "J_Tongue4": 67
 }
 
-class ExportBoneWeightsOperator(bpy.types.Operator, ExportHelper):
+class ExportBoneWeightsOperator(bpy.types.Operator, ExportHelper, WeightExportOptions):
     bl_idname = "export_weights.default"
     bl_label = "Export Bone Weights"
     filename_ext = ""
@@ -44,22 +45,7 @@ class ExportBoneWeightsOperator(bpy.types.Operator, ExportHelper):
             self.report({'WARNING'}, "No mesh objects selected.")
             return {'CANCELLED'}
 
-        for idx, obj in enumerate(selected_meshes):
-            txt_path = os.path.join(export_dir, f"Object{idx}.txt")
-
-            try:
-                with open(txt_path, 'w') as out:
-                    for v in obj.data.vertices:
-                        weights = []
-                        for g in v.groups:
-                            vg = obj.vertex_groups[g.group]
-                            bone_id = bone_name_to_max_id.get(vg.name)
-                            if bone_id is not None:
-                                weights.append(f"{bone_id} {g.weight:.6f}")
-                        out.write(" ".join(weights) + "\n")
-            except Exception as e:
-                self.report({'ERROR'}, f"Failed to export {obj.name}: {e}")
-                continue
+        export_weight_files(self, selected_meshes, export_dir, bone_name_to_max_id)
 
         self.report({'INFO'}, f"Weights exported to: {export_dir}")
         return {'FINISHED'}
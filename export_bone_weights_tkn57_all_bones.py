@@ -1,6 +1,7 @@
 import bpy
 import os
 from bpy_extras.io_utils import ExportHelper
+from .weight_export import WeightExportOptions, export_weight_files
 
 # Extended bone name to ID map from 3ds Max (provided map)
 bone_name_to_max_id = {
@@ -28,7 +29,7 @@ bone_name_to_max_id = {
     "H_Leg_Vol_C_R": 88
 }
 
-class ExportBoneWeightsAllBonesOperator(bpy.types.Operator, ExportHelper):
+class ExportBoneWeightsAllBonesOperator(bpy.types.Operator, ExportHelper, WeightExportOptions):
     bl_idname = "export_weights_all.folder"
     bl_label = "Export Bone Weights (All Bones)"
     filename_ext = ""
@@ -45,22 +46,7 @@ class ExportBoneWeightsAllBonesOperator(bpy.types.Operator, ExportHelper):
             self.report({'WARNING'}, "No mesh objects selected.")
             return {'CANCELLED'}
 
-        for idx, obj in enumerate(selected_meshes):
-            txt_path = os.path.join(export_dir, f"Object{idx}.txt")
-
-            try:
-                with open(txt_path, 'w') as out:
-                    for v in obj.data.vertices:
-                        weights = []
-                        for g in v.groups:
-                            vg = obj.vertex_groups[g.group]
-                            bone_id = bone_name_to_max_id.get(vg.name)
-                            if bone_id is not None:
-                                weights.append(f"{bone_id} {g.weight:.6f}")
-                        out.write(" ".join(weights) + "\n")
-            except Exception as e:
-                self.report({'ERROR'}, f"Failed to export {obj.name}: {e}")
-                continue
+        export_weight_files(self, selected_meshes, export_dir, bone_name_to_max_id)
 
         self.report({'INFO'}, f"Weights exported to: {export_dir}")
         return {'FINISHED'}
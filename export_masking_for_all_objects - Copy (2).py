@@ -1,9 +1,9 @@
 ﻿import bpy
-import bmesh
 from bpy.types import Operator
 from bpy_extras.io_utils import ExportHelper
 import os
 import re
+from . import mask_faces
 
 class ExportMaskListOperator(Operator, ExportHelper):
     """Export Mask List Matching Original OBJ Face Order"""
@@ -38,43 +38,28 @@ def convert_name_to_object_format(name):
     match = re.match(r"(\d+)", name)
     return f"Object{match.group(1)}" if match else name
 
-def parse_obj_faces(filepath):
-    faces = []
-    with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-        for line in f:
-            if line.startswith("f "):
-                parts = line.strip().split()[1:]
-                verts = [int(p.split('/')[0]) for p in parts]
-                if len(verts) == 3:
-                    faces.append(tuple(sorted(verts)))
-    return faces
-
 def save_mask_list(output_path, obj_source_path):
-    obj_faces = parse_obj_faces(obj_source_path)
+    face_index = None
+
+    def source_face_index():
+        nonlocal face_index
+        if face_index is None:
+            face_index = mask_faces.build_face_index(mask_faces.load_obj_faces(obj_source_path))
+            if face_index.duplicates:
+                print(f"⚠️ OBJ source: {mask_faces.describe_duplicates(face_index.duplicates)}")
+        return face_index
+
+    mask_faces.sync_edit_mode(bpy.context.selected_objects)
 
     with open(output_path, 'w') as out_file:
         for obj in bpy.context.selected_objects:
             if obj.type != 'MESH':
                 continue
 
-            bpy.context.view_layer.objects.active = obj
-            bpy.ops.object.mode_set(mode='EDIT')
-
-            bm = bmesh.from_edit_mesh(obj.data)
-            bm.faces.ensure_lookup_table()
-
-            selected_indices = []
-            for face in bm.faces:
-                if face.select:
-                    obj_indices = [loop.vert.index + 1 for loop in face.loops]
-                    key = tuple(sorted(obj_indices))
-                    try:
-                        face_index = obj_faces.index(key) + 1
-                        selected_indices.append(face_index)
-                    except ValueError:
-                        print(f"⚠️ Face {key} not found in OBJ source")
-
-            bpy.ops.object.mode_set(mode='OBJECT')
+            positions, missing = mask_faces.selected_obj_positions(obj.data, source_face_index)
+            if missing:
+                print(f"⚠️ {missing} selected faces of {obj.name} not found in OBJ source")
+            selected_indices = (positions + 1).tolist()
 
             if selected_indices:
                 object_name = convert_name_to_object_format(obj.name)
@@ -3,6 +3,7 @@ from bpy.types import Operator
 from bpy_extras.io_utils import ExportHelper
 import os
 import re
+from . import mask_faces
 
 class ExportMaskListOperator(Operator, ExportHelper):
     """Export Mask List to a Text File"""
@@ -38,10 +39,9 @@ def save_mask_list(filepath):
     Args:
         filepath (str): Path to save the mask list.
     """
-    # Ensure we are in Object Mode
-    if bpy.context.object and bpy.context.object.mode != 'OBJECT':
-        bpy.ops.object.mode_set(mode='OBJECT')
-    
+    # Bring any edit-mode selection into the mesh data once
+    mask_faces.sync_edit_mode(bpy.context.selected_objects)
+
     # Open the file for writing
     with open(filepath, 'w') as out_file:
         # Loop through all selected objects
@@ -49,14 +49,8 @@ def save_mask_list(filepath):
             if obj.type == 'MESH':
                 print(f"Processing object: {obj.name}")
                 
-                # Set active and go into Edit Mode if not already
-                bpy.context.view_layer.objects.active = obj
-                if bpy.context.object.mode != 'EDIT':
-                    bpy.ops.object.mode_set(mode='EDIT')
-                
-                # Update view and get face selection
-                bpy.ops.object.mode_set(mode='OBJECT')
-                selected_faces = [f.index + 1 for f in obj.data.polygons if f.select]  # +1 to match 3ds Max
+                # Get face selection
+                selected_faces = (mask_faces.read_face_selection(obj.data).nonzero()[0] + 1).tolist()  # +1 to match 3ds Max
 
                 if selected_faces:
                     # Convert the name to "ObjectX"
@@ -70,10 +64,6 @@ def save_mask_list(filepath):
                     out_file.write(f"{face_list}\n")
                     
                     print(f"Exported mask list for {object_name}: {face_list}")
-                
-                # Go back to Object Mode
-                if bpy.context.object.mode != 'OBJECT':
-                    bpy.ops.object.mode_set(mode='OBJECT')
 
     print(f"Mask list exported successfully to {filepath}.")
 
@@ -1,25 +1,25 @@
 ﻿import bpy
-import bmesh
 import os
 import re
+from . import mask_faces
 
 def convert_name_to_object_format(name):
     match = re.match(r"(\d+)", name)
     return f"Object{match.group(1)}" if match else name
 
-def parse_obj_faces(filepath):
-    faces = []
-    with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
-        for line in f:
-            if line.startswith("f "):
-                parts = line.strip().split()[1:]
-                verts = [int(p.split('/')[0]) for p in parts]
-                if len(verts) == 3:
-                    faces.append(tuple(sorted(verts)))
-    return faces
+def load_face_index(obj_path, name):
+    if not os.path.isfile(obj_path):
+        print(f"❌ Skipping {name}: '{name}.obj' not found in export directory")
+        return None
+
+    face_index = mask_faces.build_face_index(mask_faces.load_obj_faces(obj_path))
+    if face_index.duplicates:
+        print(f"⚠️ {name}.obj: {mask_faces.describe_duplicates(face_index.duplicates)}")
+    return face_index
 
 def save_mask_list(output_path):
     output_dir = os.path.dirname(output_path)
+    mask_faces.sync_edit_mode(bpy.context.selected_objects)
 
     with open(output_path, 'w') as out_file:
         for obj in bpy.context.selected_objects:
@@ -27,29 +27,13 @@ def save_mask_list(output_path):
                 continue
 
             obj_path = os.path.join(output_dir, obj.name + ".obj")
-            if not os.path.isfile(obj_path):
-                print(f"❌ Skipping {obj.name}: '{obj.name}.obj' not found in export directory")
+            mapped = mask_faces.selected_obj_positions(obj.data, lambda: load_face_index(obj_path, obj.name))
+            if mapped is None:
                 continue
-
-            obj_faces = parse_obj_faces(obj_path)
-
-            bpy.context.view_layer.objects.active = obj
-            bpy.ops.object.mode_set(mode='EDIT')
-            bm = bmesh.from_edit_mesh(obj.data)
-            bm.faces.ensure_lookup_table()
-
-            selected_indices = []
-            for face in bm.faces:
-                if face.select:
-                    verts = [loop.vert.index + 1 for loop in face.loops]
-                    key = tuple(sorted(verts))
-                    try:
-                        face_index = obj_faces.index(key) + 1
-                        selected_indices.append(face_index)
-                    except ValueError:
-                        print(f"⚠️ Face {key} not found in {obj.name}")
-
-            bpy.ops.object.mode_set(mode='OBJECT')
+            positions, missing = mapped
+            if missing:
+                print(f"⚠️ {missing} selected faces not found in {obj.name}")
+            selected_indices = (positions + 1).tolist()
 
             if selected_indices:
                 object_name = convert_name_to_object_format(obj.name)
@@ -1,6 +1,9 @@
 import bpy
 import os
 from bpy_extras.io_utils import ExportHelper
+from . import wavefront_normals
+from . import wavefront_normals_live
+from . import worker_pool
 
 class ExportWavefrontNormalsOperator(bpy.types.Operator, ExportHelper):
     bl_idname = "export.wavefront_normals"
@@ -14,6 +17,30 @@ class ExportWavefrontNormalsOperator(bpy.types.Operator, ExportHelper):
         default=True
     )
 
+    split_vertices: bpy.props.BoolProperty(
+        name="Split Seams",
+        description="Write one vertex per distinct vertex/normal/UV corner, plus a _remap.txt listing the source vertex of each",
+        default=False
+    )
+
+    write_binary: bpy.props.BoolProperty(
+        name="Binary Dump",
+        description="Also write a compact float32 _normals.bin with the same data as the OBJ",
+        default=False
+    )
+
+    use_parallel: bpy.props.BoolProperty(
+        name="Parallel Export",
+        description="Format and write the OBJ files in worker processes, one per CPU core",
+        default=False
+    )
+
+    live_update: bpy.props.BoolProperty(
+        name="Live Update",
+        description="Keep re-exporting these meshes into the same folder whenever their geometry changes",
+        default=False
+    )
+
     def execute(self, context):
         selected_objects = context.selected_objects
         depsgraph = context.evaluated_depsgraph_get()
@@ -22,6 +49,9 @@ class ExportWavefrontNormalsOperator(bpy.types.Operator, ExportHelper):
             self.report({'ERROR'}, "No objects selected.")
             return {'CANCELLED'}
 
+        jobs = []
+        exported = {}
+
         for idx, mesh_obj in enumerate(selected_objects):
             if mesh_obj.type != 'MESH':
                 continue
@@ -29,55 +59,18 @@ class ExportWavefrontNormalsOperator(bpy.types.Operator, ExportHelper):
             mesh_name = mesh_obj.name.replace(":skinned", "")
             file_full_path = os.path.join(self.filepath, f"{idx}_{mesh_name}_normals.obj")
 
-            mesh_eval = mesh_obj.evaluated_get(depsgraph).to_mesh(preserve_all_data_layers=True, depsgraph=depsgraph)
-            mesh_eval.calc_normals_split()
-
-            verts = mesh_eval.vertices
-            loops = mesh_eval.loops
-            polygons = mesh_eval.polygons
-            uv_layer = mesh_eval.uv_layers.active.data
-
-            with open(file_full_path, 'w') as file:
-                file.write("# Wavefront OBJ exported from Blender\n")
-                file.write(f"# Vertices: {len(verts)}\n")
-                file.write(f"# UVs: {len(verts)}\n")
-                file.write(f"# Normals: {len(verts)}\n")
-
-                for v in verts:
-                    if self.rotate_model:
-                        file.write(f"v {v.co.x} {-v.co.y} {-v.co.z}\n")
-                    else:
-                        file.write(f"v {v.co.x} {v.co.y} {v.co.z}\n")
-
-                vert_normals = [None] * len(verts)
-                for loop in loops:
-                    vert_normals[loop.vertex_index] = loop.normal
-
-                for n in vert_normals:
-                    if self.rotate_model:
-                        file.write(f"vn {-n.x} {-n.y} {n.z}\n")
-                    else:
-                        file.write(f"vn {-n.x} {n.y} {-n.z}\n")
-
-                vert_uvs = [None] * len(verts)
-                for loop in loops:
-                    vert_uvs[loop.vertex_index] = uv_layer[loop.index].uv
-
-                for uv in vert_uvs:
-                    file.write(f"vt {uv.x} {uv.y} 0\n")
-
-                file.write(f"g {mesh_name}\n")
-                file.write("s 1\n")
-
-                for poly in polygons:
-                    face_str = "f"
-                    vertices = reversed(poly.vertices) if self.rotate_model else poly.vertices
-                    for vert_idx in vertices:
-                        idx1 = vert_idx + 1
-                        face_str += f" {idx1}/{idx1}/{idx1}"
-                    file.write(face_str + "\n")
-
-            mesh_obj.to_mesh_clear()
+            # Snapshot the evaluated mesh and free it before anything is written
+            arrays = wavefront_normals.snapshot_mesh(mesh_obj, depsgraph)
+            exported[mesh_obj.name] = (file_full_path, mesh_name)
+            jobs.append((file_full_path, mesh_name, arrays, self.rotate_model, self.split_vertices, self.write_binary))
+
+        for args, outcome in zip(jobs, worker_pool.run_jobs(wavefront_normals.write_normals_obj, jobs, self.use_parallel)):
+            if isinstance(outcome, Exception):
+                self.report({'ERROR'}, f"Failed to write {args[0]}: {outcome}")
+
+        wavefront_normals_live.remember_export(exported, self.rotate_model, self.split_vertices, self.write_binary)
+        if self.live_update:
+            wavefront_normals_live.start()
 
         self.report({'INFO'}, f"Successfully exported to: {self.filepath}")
         return {'FINISHED'}
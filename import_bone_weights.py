@@ -0,0 +1,84 @@
+import bpy
+import os
+import numpy as np
+from bpy_extras.io_utils import ImportHelper
+from bpy.props import BoolProperty, EnumProperty, StringProperty
+from . import rig_maps
+from . import weight_files
+from . import weight_table
+
+class ImportBoneWeightsOperator(bpy.types.Operator, ImportHelper):
+    """Load Object{idx}.txt/.bin weight files back into the vertex groups of the selected meshes"""
+    bl_idname = "import_weights.folder"
+    bl_label = "Import Bone Weights"
+    bl_options = {'UNDO'}
+    filename_ext = ""
+    use_filter_folder = True
+    directory: StringProperty(subtype='DIR_PATH')
+
+    rig: EnumProperty(
+        name="Rig",
+        description="Bone map the weight files were exported with",
+        items=rig_maps.RIG_ITEMS,
+        default='TKN57',
+    )
+
+    replace_existing: BoolProperty(
+        name="Replace Existing",
+        description="Clear the current weights of every group found in a file before assigning",
+        default=True,
+    )
+
+    def execute(self, context):
+        selected_meshes = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        if not selected_meshes:
+            self.report({'WARNING'}, "No mesh objects selected.")
+            return {'CANCELLED'}
+
+        bone_map = next(rig[3] for rig in rig_maps.RIGS if rig[0] == self.rig)
+        bone_names = {bone_id: name for name, bone_id in bone_map.items()}
+        bone_ids = np.array(list(bone_names), dtype=np.int32)
+
+        imported = []
+        for idx, obj in enumerate(selected_meshes):
+            candidates = [f"Object{idx}.txt", f"Object{idx}.bin"]
+            file_name = next((name for name in candidates if os.path.isfile(os.path.join(self.directory, name))), None)
+            if file_name is None:
+                self.report({'WARNING'}, f"Skipping {obj.name}: neither Object{idx}.txt nor Object{idx}.bin found in {self.directory}")
+                continue
+            file_path = os.path.join(self.directory, file_name)
+
+            try:
+                table = weight_files.read_weight_file(file_path)
+                vertex_count = len(table.offsets) - 1
+                if vertex_count != len(obj.data.vertices):
+                    self.report({'ERROR'}, f"Skipping {obj.name}: {file_name} has {vertex_count} vertices, mesh has {len(obj.data.vertices)}")
+                    continue
+
+                if table.groups.min(initial=0) < 0:
+                    raise ValueError("negative bone ID")
+
+                # Identity lookup over the rig's bone IDs, -1 for IDs it does not know
+                lookup = np.full(max(bone_ids.max(), table.groups.max(initial=0)) + 1, -1, dtype=np.int32)
+                lookup[bone_ids] = bone_ids
+                mapped = weight_table.remap_groups(table, lookup)
+                unknown = len(table.groups) - len(mapped.groups)
+                if unknown:
+                    self.report({'WARNING'}, f"{obj.name}: skipped {unknown} weights with bone IDs missing from the rig map")
+
+                weight_table.write_vertex_weights(obj, mapped, bone_names, self.replace_existing)
+                imported.append(obj.name)
+            except Exception as e:
+                self.report({'ERROR'}, f"Failed to import {file_name} into {obj.name}: {e}")
+
+        self.report({'INFO'}, f"Weights imported into: {', '.join(imported)}")
+        return {'FINISHED'}
+
+def register():
+    bpy.utils.register_class(ImportBoneWeightsOperator)
+
+def unregister():
+    bpy.utils.unregister_class(ImportBoneWeightsOperator)
+
+if __name__ == "__main__":
+    register()
@@ -2,6 +2,7 @@
 from bpy.types import Operator
 from bpy_extras.io_utils import ImportHelper
 from pathlib import Path
+from . import mask_faces
 
 class ImportObjPreserveOrderOperator(Operator, ImportHelper):
     """Import multiple OBJ files and preserve face order"""
@@ -22,11 +23,14 @@ class ImportObjPreserveOrderOperator(Operator, ImportHelper):
 
             # Import OBJ file using built-in minimal call
             bpy.ops.import_scene.obj(filepath=str(obj_path),split_mode='OFF')
+            face_index = mask_faces.build_face_index(mask_faces.load_obj_faces(str(obj_path)))
 
-            # Tag newly selected mesh objects with custom property
+            # Tag newly selected mesh objects with custom property, and every
+            # polygon with the OBJ face it came from for the mask exporters
             for obj in context.selected_objects:
                 if obj.type == 'MESH':
                     obj["original_obj_path"] = str(obj_path.resolve())
+                    mask_faces.store_face_positions(obj.data, mask_faces.polygon_face_positions(obj.data, face_index))
                     imported.append(obj.name)
 
         self.report({'INFO'}, f"✅ Imported: {', '.join(imported)}")
@@ -0,0 +1,64 @@
+import bpy
+import os
+from bpy_extras.io_utils import ImportHelper
+from bpy.props import BoolProperty, StringProperty
+from . import shape_key_files
+from . import worker_pool
+
+class ImportShapeKeysOperator(bpy.types.Operator, ImportHelper):
+    """Create or update one shape key of the active mesh per OBJ in a folder (same vertex order as the Basis)"""
+    bl_idname = "import_shape_keys.folder"
+    bl_label = "Import Shape Keys from OBJs"
+    bl_options = {'UNDO'}
+    filename_ext = ""
+    use_filter_folder = True
+    directory: StringProperty(subtype='DIR_PATH')
+
+    use_parallel: BoolProperty(
+        name="Parallel Import",
+        description="Parse the OBJ files in worker processes, one per CPU core",
+        default=True,
+    )
+
+    def execute(self, context):
+        obj = context.object
+        if not obj or obj.type != 'MESH':
+            self.report({'ERROR'}, "Select a mesh object to import the shape keys into.")
+            return {'CANCELLED'}
+
+        file_names = sorted(name for name in os.listdir(self.directory) if name.lower().endswith(".obj"))
+        if not file_names:
+            self.report({'WARNING'}, f"No OBJ files found in: {self.directory}")
+            return {'CANCELLED'}
+        paths = [os.path.join(self.directory, name) for name in file_names]
+
+        parsed = {}
+        outcomes = worker_pool.run_jobs(shape_key_files.read_obj_vertices, [(path,) for path in paths], self.use_parallel)
+        for file_name, outcome in zip(file_names, outcomes):
+            if isinstance(outcome, Exception):
+                self.report({'ERROR'}, f"Failed to read {file_name}: {outcome}")
+            else:
+                parsed[file_name] = outcome
+
+        # Check every file before any key is touched
+        vertex_count = len(obj.data.vertices)
+        for file_name, coords in list(parsed.items()):
+            if len(coords) != vertex_count:
+                self.report({'ERROR'}, f"Skipping {file_name}: {len(coords)} vertices, {obj.name} has {vertex_count}")
+                del parsed[file_name]
+
+        for file_name, coords in parsed.items():
+            shape_key_files.set_key_coords(obj, os.path.splitext(file_name)[0], coords)
+        obj.data.update()
+
+        self.report({'INFO'}, f"Imported {len(parsed)} of {len(file_names)} shape keys into {obj.name}")
+        return {'FINISHED'}
+
+def register():
+    bpy.utils.register_class(ImportShapeKeysOperator)
+
+def unregister():
+    bpy.utils.unregister_class(ImportShapeKeysOperator)
+
+if __name__ == "__main__":
+    register()
@@ -0,0 +1,269 @@
+import os
+import struct
+import numpy as np
+from collections import namedtuple
+
+# Face keys are sorted 1-based vertex triples, packed into one int64 each
+# (21 bits per vertex) so they can be sorted and searched as scalars
+_KEY_BITS = 21
+MAX_KEY_VERTEX = (1 << _KEY_BITS) - 1
+
+# parse_obj_faces results are cached next to the OBJ in <name>.obj.faces:
+# magic b"TKNF", uint16 version, uint16 reserved, uint64 OBJ size,
+# int64 OBJ mtime (ns), uint32 path length, UTF-8 absolute OBJ path,
+# then the triangles as int32[n, 3]
+CACHE_SUFFIX = ".faces"
+_CACHE_MAGIC = b"TKNF"
+_CACHE_VERSION = 1
+_CACHE_HEADER = struct.Struct("<4sHHQqI")
+
+# Integer face attribute holding each polygon's OBJ face position (-1 for
+# none), written by the preserve-order importer
+FACE_INDEX_ATTRIBUTE = "obj_face_index"
+
+# Sorted packed keys of an OBJ's triangles and the face position of each
+# (the first face for keys used more than once); duplicates maps every such
+# key tuple to all of its positions.
+FaceIndex = namedtuple("FaceIndex", ("keys", "positions", "duplicates"))
+
+
+def _face_lines(data):
+    """The bytes of every "f" line of an OBJ, each ending in a newline."""
+    line_starts = np.concatenate(([0], np.flatnonzero(data[:-1] == ord("\n")) + 1))
+    line_lengths = np.diff(np.append(line_starts, len(data)))
+    second = data[np.minimum(line_starts + 1, len(data) - 1)]
+    is_face = (data[line_starts] == ord("f")) & ((second == ord(" ")) | (second == ord("\t")))
+    return np.append(data[np.repeat(is_face, line_lengths)], np.uint8(ord("\n")))
+
+
+def _segments_after(chars, breaks, marker):
+    """True for bytes whose closest preceding break byte (the first byte counts as one) is marker."""
+    starts = np.concatenate(([0], np.flatnonzero(breaks[1:]) + 1))
+    return np.repeat(chars[starts] == ord(marker), np.diff(np.append(starts, len(chars))))
+
+
+def parse_obj_faces(filepath):
+    """Return the 1-based vertex triples of every triangle in an OBJ, in file order, as an (n, 3) int32 array.
+
+    The file is memory-mapped and only its "f" lines are scanned, with a few
+    whole-array passes. Of each corner (v, v/vt, v//vn, v/vt/vn) only the
+    vertex index is kept.
+    """
+    if os.path.getsize(filepath) == 0:
+        return np.empty((0, 3), dtype=np.int32)
+    chars = _face_lines(np.memmap(filepath, dtype=np.uint8, mode='r'))
+
+    # Keep the number that starts each corner: digit runs not preceded by "/" and outside comments
+    is_newline = chars == ord("\n")
+    is_number = ((chars >= ord("0")) & (chars <= ord("9"))) | (chars == ord("-"))
+    keep = is_number & ~_segments_after(chars, ~is_number, "/")
+    if np.any(chars == ord("#")):
+        keep &= ~_segments_after(chars, is_newline | (chars == ord("#")), "#")
+
+    # Count the corners of every line, then convert all of them at once
+    token_start = keep.copy()
+    token_start[1:] &= ~keep[:-1]
+    line_of_token = np.searchsorted(np.flatnonzero(is_newline), np.flatnonzero(token_start))
+    if not len(line_of_token):
+        return np.empty((0, 3), dtype=np.int32)
+    corners = np.bincount(line_of_token)[line_of_token]
+    values = np.fromstring(np.where(keep, chars, np.uint8(ord(" "))).tobytes(), dtype=np.int64, sep=" ")
+    if len(values) != len(corners):
+        raise ValueError(f"{os.path.basename(filepath)}: face lines must hold integer vertex indices")
+    return values[corners == 3].astype(np.int32).reshape(-1, 3)
+
+
+def _cache_key(path, stat):
+    return _CACHE_MAGIC, _CACHE_VERSION, 0, stat.st_size, stat.st_mtime_ns, path.encode("utf-8")
+
+
+def _read_cache(cache_path, key):
+    try:
+        with open(cache_path, 'rb') as f:
+            header = _CACHE_HEADER.unpack(f.read(_CACHE_HEADER.size))
+            if header[:5] != key[:5] or f.read(header[5]) != key[5]:
+                return None
+            return np.fromfile(f, dtype="<i4").astype(np.int32).reshape(-1, 3)
+    except (OSError, struct.error, ValueError):
+        return None
+
+
+def _write_cache(cache_path, key, triangles):
+    temp_path = cache_path + ".tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(_CACHE_HEADER.pack(*key[:5], len(key[5])))
+        f.write(key[5])
+        f.write(triangles.astype("<i4").tobytes())
+    os.replace(temp_path, cache_path)
+
+
+def load_obj_faces(filepath):
+    """parse_obj_faces, cached in a sidecar file keyed by the OBJ's path, size and mtime."""
+    path = os.path.abspath(filepath)
+    key = _cache_key(path, os.stat(path))
+    cache_path = path + CACHE_SUFFIX
+    triangles = _read_cache(cache_path, key)
+    if triangles is None:
+        triangles = parse_obj_faces(path)
+        try:
+            _write_cache(cache_path, key, triangles)
+        except OSError:
+            # A read-only folder only costs the cache
+            pass
+    return triangles
+
+
+def pack_keys(triangles):
+    """Pack (n, 3) vertex triples into one int64 key each, independent of corner order."""
+    triangles = np.sort(np.asarray(triangles, dtype=np.int64), axis=1)
+    if len(triangles) and (triangles.min() < 0 or triangles.max() > MAX_KEY_VERTEX):
+        raise ValueError(f"face vertex indices must lie between 0 and {MAX_KEY_VERTEX}")
+    return (triangles[:, 0] << 2 * _KEY_BITS) | (triangles[:, 1] << _KEY_BITS) | triangles[:, 2]
+
+
+def build_face_index(triangles):
+    """Index an OBJ's triangles (as returned by parse_obj_faces) by face key.
+
+    A key used by several faces maps to the first of them; duplicates lists
+    all of their positions by sorted key tuple.
+    """
+    triangles = np.sort(np.asarray(triangles, dtype=np.int64), axis=1)
+    order = np.lexsort((triangles[:, 2], triangles[:, 1], triangles[:, 0]))
+    keys = pack_keys(triangles)[order]
+
+    # lexsort is stable, so the first position of each run of equal keys is its first face
+    first = np.ones(len(keys), dtype=bool)
+    first[1:] = keys[1:] != keys[:-1]
+    duplicates = {}
+    for start, end in zip(*_runs(first)):
+        if end - start > 1:
+            duplicates[tuple(triangles[order[start]].tolist())] = order[start:end].tolist()
+    return FaceIndex(keys[first], order[first], duplicates)
+
+
+def _runs(first):
+    starts = np.flatnonzero(first)
+    return starts.tolist(), np.append(starts[1:], len(first)).tolist()
+
+
+def describe_duplicates(duplicates, limit=3):
+    """One-line summary of a FaceIndex's duplicates for warnings."""
+    shown = "; ".join(f"{key} at faces {', '.join(str(p + 1) for p in positions)}"
+                      for key, positions in list(duplicates.items())[:limit])
+    more = f" and {len(duplicates) - limit} more" if len(duplicates) > limit else ""
+    return f"{len(duplicates)} face keys are used by more than one face ({shown}{more}); the first face is used"
+
+
+def _polygon_loops(mesh):
+    polygon_count = len(mesh.polygons)
+    loop_starts = np.empty(polygon_count, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    loop_totals = np.empty(polygon_count, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    return loop_starts, loop_totals, loop_verts
+
+
+def read_face_selection(mesh):
+    select = np.empty(len(mesh.polygons), dtype=bool)
+    mesh.polygons.foreach_get("select", select)
+    return select
+
+
+def selected_triangles(mesh):
+    """Read the selected polygons of a mesh with foreach_get.
+
+    Returns (triangles, other): the 1-based vertex triples of the selected
+    triangles in polygon order, and the number of selected polygons that
+    are not triangles (they cannot match an OBJ triangle).
+    """
+    select = read_face_selection(mesh)
+    loop_starts, loop_totals, loop_verts = _polygon_loops(mesh)
+
+    triangles = select & (loop_totals == 3)
+    corners = loop_starts[triangles, None] + np.arange(3)
+    return loop_verts[corners] + 1, int(np.count_nonzero(select)) - int(np.count_nonzero(triangles))
+
+
+def match_faces(face_index, triangles):
+    """OBJ face position of every (n, 3) vertex triple, or -1 where the OBJ has no such face."""
+    keys = pack_keys(triangles)
+    if not len(face_index.keys):
+        return np.full(len(keys), -1, dtype=np.int64)
+    found = np.minimum(np.searchsorted(face_index.keys, keys), len(face_index.keys) - 1)
+    return np.where(face_index.keys[found] == keys, face_index.positions[found], -1)
+
+
+def map_selection(mesh, face_index):
+    """OBJ face positions of the mesh's selected triangles, in polygon order.
+
+    Returns (positions, missing), where missing counts the selected faces
+    that have no matching OBJ triangle.
+    """
+    triangles, other = selected_triangles(mesh)
+    positions = match_faces(face_index, triangles)
+    matched = positions[positions >= 0]
+    return matched, len(positions) - len(matched) + other
+
+
+def polygon_face_positions(mesh, face_index):
+    """OBJ face position of every polygon of mesh, -1 where no OBJ triangle matches."""
+    loop_starts, loop_totals, loop_verts = _polygon_loops(mesh)
+    is_triangle = loop_totals == 3
+    positions = np.full(len(loop_totals), -1, dtype=np.int32)
+    positions[is_triangle] = match_faces(face_index, loop_verts[loop_starts[is_triangle, None] + np.arange(3)] + 1)
+    return positions
+
+
+def store_face_positions(mesh, positions):
+    """Save per-polygon OBJ face positions in the mesh's integer face attribute."""
+    attribute = mesh.attributes.get(FACE_INDEX_ATTRIBUTE)
+    if attribute is not None:
+        mesh.attributes.remove(attribute)
+    attribute = mesh.attributes.new(FACE_INDEX_ATTRIBUTE, 'INT', 'FACE')
+    attribute.data.foreach_set("value", np.asarray(positions, dtype=np.int32))
+
+
+def stored_face_positions(mesh):
+    """The per-polygon OBJ face positions saved by the importer, or None if the mesh has none."""
+    attribute = mesh.attributes.get(FACE_INDEX_ATTRIBUTE)
+    if attribute is None or attribute.domain != 'FACE' or attribute.data_type != 'INT':
+        return None
+    positions = np.empty(len(mesh.polygons), dtype=np.int32)
+    attribute.data.foreach_get("value", positions)
+    return positions
+
+
+def map_stored_selection(mesh, positions):
+    """Like map_selection, but from stored per-polygon positions instead of the OBJ."""
+    picked = positions[read_face_selection(mesh)]
+    matched = picked[picked >= 0]
+    return matched, len(picked) - len(matched)
+
+
+def selected_obj_positions(mesh, get_face_index):
+    """OBJ face positions of the selected faces of mesh, and how many were not found.
+
+    Meshes from the preserve-order importer carry their OBJ face indices, which
+    are used as they are. Any other mesh is matched against the FaceIndex that
+    get_face_index() returns; it is only called then. None if it returns None.
+    """
+    stored = stored_face_positions(mesh)
+    if stored is not None:
+        return map_stored_selection(mesh, stored)
+    face_index = get_face_index()
+    if face_index is None:
+        return None
+    return map_selection(mesh, face_index)
+
+
+def sync_edit_mode(objects):
+    """Write the edit-mode state of any of objects being edited back to its mesh.
+
+    Afterwards polygon select flags can be read from mesh data without
+    switching modes.
+    """
+    for obj in objects:
+        if obj.type == 'MESH' and obj.mode == 'EDIT':
+            obj.update_from_editmode()
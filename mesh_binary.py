@@ -0,0 +1,56 @@
+"""Binary _normals.bin mesh dumps written next to the normals OBJs.
+
+Holds the same data as the OBJ, with the same axis conventions and vertex
+order, but faces use 0-based vertex indices.
+
+Layout (little-endian):
+    header        magic b"TKNM", uint16 version, uint16 reserved,
+                  uint32 vertex count V, uint32 face count F, uint32 corner count C
+    positions     float32[V, 3]
+    normals       float32[V, 3]
+    uvs           float32[V, 2]
+    face_offsets  uint32[F + 1]  corners of face i are face_verts[face_offsets[i]:face_offsets[i + 1]]
+    face_verts    uint32[C]
+"""
+import struct
+from collections import namedtuple
+import numpy as np
+
+MAGIC = b"TKNM"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHHIII")
+
+BinaryMesh = namedtuple("BinaryMesh", ("positions", "normals", "uvs", "face_offsets", "face_verts"))
+
+
+def write_mesh(path, positions, normals, uvs, face_offsets, face_verts):
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, len(positions), len(face_offsets) - 1, len(face_verts)))
+        f.write(np.asarray(positions).astype("<f4").tobytes())
+        f.write(np.asarray(normals).astype("<f4").tobytes())
+        f.write(np.asarray(uvs).astype("<f4").tobytes())
+        f.write(np.asarray(face_offsets).astype("<u4").tobytes())
+        f.write(np.asarray(face_verts).astype("<u4").tobytes())
+
+
+def read_mesh(path):
+    """Memory-map a mesh dump and return zero-copy views of its arrays."""
+    data = np.memmap(path, dtype=np.uint8, mode='r')
+    magic, version, _reserved, vertex_count, face_count, corner_count = _HEADER.unpack(data[:_HEADER.size].tobytes())
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} TKNM mesh file")
+
+    arrays = []
+    start = _HEADER.size
+    for dtype, shape in (
+        ("<f4", (vertex_count, 3)),
+        ("<f4", (vertex_count, 3)),
+        ("<f4", (vertex_count, 2)),
+        ("<u4", (face_count + 1,)),
+        ("<u4", (corner_count,)),
+    ):
+        end = start + 4 * int(np.prod(shape))
+        arrays.append(data[start:end].view(dtype).reshape(shape))
+        start = end
+    return BinaryMesh(*arrays)
@@ -0,0 +1,17 @@
+from . import export_bone_weights_charlotte_flair
+from . import export_bone_weights_john_cena
+from . import export_bone_weights_steve_austin
+from . import export_bone_weights_tkn57
+from . import export_bone_weights_tkn57_all_bones
+
+# (identifier, label, export subfolder, bone name -> 3ds Max ID map)
+RIGS = (
+    ("TKN57", "TKN57", "tkn57", export_bone_weights_tkn57.bone_name_to_max_id),
+    ("ALL_BONES", "TKN57 (All Bones)", "all_bones", export_bone_weights_tkn57_all_bones.bone_name_to_max_id),
+    ("JOHN_CENA", "John Cena Base", "john_cena", export_bone_weights_john_cena.bone_name_to_max_id),
+    ("STEVE_AUSTIN", "Steve Austin Base", "steve_austin", export_bone_weights_steve_austin.bone_name_to_max_id),
+    ("CHARLOTTE_FLAIR", "Charlotte Flair Base", "charlotte_flair", export_bone_weights_charlotte_flair.bone_name_to_max_id),
+)
+
+RIG_ITEMS = [(identifier, label, "") for identifier, label, _folder, _bone_map in RIGS]
+
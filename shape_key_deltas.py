@@ -0,0 +1,98 @@
+"""Sparse shape key delta files.
+
+Each key stores only the vertices it moves, as offsets from the Basis in the
+mesh's local space. The directory at the front lets one key be loaded
+without reading the records of any other key.
+
+Layout (little-endian):
+    header     magic b"TKND", uint16 version, uint16 reserved,
+               uint32 key count K, uint32 vertex count V, uint32 directory size in bytes
+    directory  K entries of uint64 first record, uint32 record count,
+               uint16 name length, UTF-8 name
+    padding    to a 16 byte boundary
+    records    (uint32 vertex index, float32 dx, float32 dy, float32 dz), grouped by key
+"""
+import struct
+from collections import namedtuple
+import numpy as np
+
+MAGIC = b"TKND"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHHIII")
+_ENTRY = struct.Struct("<QIH")
+RECORD = np.dtype([("vertex", "<u4"), ("delta", "<f4", (3,))])
+
+KeyEntry = namedtuple("KeyEntry", ("name", "first", "count"))
+KeyDeltas = namedtuple("KeyDeltas", ("vertices", "deltas"))
+
+
+def _align16(size):
+    return (size + 15) & ~15
+
+
+def sparse_deltas(key_coords, reference, epsilon=1e-5):
+    """Find the moved vertices of every key.
+
+    key_coords is a (keys, vertices, 3) array and reference the (vertices, 3)
+    Basis, or one reference per key. Returns CSR (offsets, vertices, deltas):
+    key i moves vertices[offsets[i]:offsets[i + 1]] by the matching deltas.
+    A vertex counts as moved when its offset is longer than epsilon.
+    """
+    deltas = np.asarray(key_coords, dtype=np.float32) - np.asarray(reference, dtype=np.float32)
+    moved = np.einsum("kvi,kvi->kv", deltas, deltas) > epsilon * epsilon
+    keys, vertices = np.nonzero(moved)
+    offsets = np.zeros(len(deltas) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=len(deltas)), out=offsets[1:])
+    return offsets, vertices, deltas[keys, vertices]
+
+
+def write_deltas(path, names, vertex_count, offsets, vertices, deltas):
+    offsets = np.asarray(offsets, dtype=np.int64)
+    directory = b"".join(
+        _ENTRY.pack(int(offsets[i]), int(offsets[i + 1] - offsets[i]), len(encoded)) + encoded
+        for i, encoded in enumerate(name.encode("utf-8") for name in names))
+    records = np.empty(len(vertices), dtype=RECORD)
+    records["vertex"] = vertices
+    records["delta"] = deltas
+
+    directory_end = _HEADER.size + len(directory)
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, 0, len(names), vertex_count, len(directory)))
+        f.write(directory)
+        f.write(bytes(_align16(directory_end) - directory_end))
+        f.write(records.tobytes())
+
+
+def read_directory(path):
+    """Return (vertex count, records start, [KeyEntry, ...]) without touching any records."""
+    with open(path, 'rb') as f:
+        magic, version, _reserved, key_count, vertex_count, directory_size = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} TKND delta file")
+        directory = f.read(directory_size)
+
+    entries = []
+    position = 0
+    for _ in range(key_count):
+        first, count, name_length = _ENTRY.unpack_from(directory, position)
+        position += _ENTRY.size
+        entries.append(KeyEntry(directory[position:position + name_length].decode("utf-8"), first, count))
+        position += name_length
+    return vertex_count, _align16(_HEADER.size + directory_size), entries
+
+
+def read_key(path, name):
+    """Memory-map the records of one key and return zero-copy (vertices, deltas) views."""
+    _vertex_count, records_start, entries = read_directory(path)
+    for entry in entries:
+        if entry.name == name:
+            break
+    else:
+        raise KeyError(f"{path} has no shape key named {name!r}")
+
+    if entry.count == 0:
+        records = np.empty(0, dtype=RECORD)
+    else:
+        records = np.memmap(path, dtype=RECORD, mode='r', offset=records_start + RECORD.itemsize * entry.first, shape=(entry.count,))
+    return KeyDeltas(records["vertex"], records["delta"])
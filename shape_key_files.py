@@ -0,0 +1,252 @@
+import fnmatch
+import os
+import re
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from . import shape_key_deltas
+from . import text_format
+from . import weight_table
+
+# export_scene.obj's default axes (forward -Z, up Y): (x, y, z) -> (x, z, -y)
+AXIS_CONVERSION = np.array((
+    (1.0, 0.0, 0.0, 0.0),
+    (0.0, 0.0, 1.0, 0.0),
+    (0.0, -1.0, 0.0, 0.0),
+    (0.0, 0.0, 0.0, 1.0),
+))
+
+
+def read_key_coords(key_blocks, indices):
+    """Return a (len(indices), vertices, 3) float32 array of the given key blocks' coordinates."""
+    vertex_count = len(key_blocks[0].data)
+    coords = np.empty((len(indices), vertex_count, 3), dtype=np.float32)
+    for row, index in enumerate(indices):
+        key_blocks[index].data.foreach_get("co", coords[row].ravel())
+    return coords
+
+
+def select_keys(key_blocks, pattern="", use_regex=False, skip_muted=False):
+    """Indices of every key but the Basis whose name matches pattern.
+
+    pattern is a wildcard pattern ("viseme_*") or, with use_regex, a regular
+    expression searched in the name. An empty pattern matches every key.
+    """
+    if use_regex:
+        matches = re.compile(pattern).search
+    elif pattern:
+        matches = lambda name: fnmatch.fnmatchcase(name, pattern)
+    else:
+        matches = lambda name: True
+    return [index for index, key_block in enumerate(key_blocks)
+            if index > 0 and matches(key_block.name) and not (skip_muted and key_block.mute)]
+
+
+def reference_indices(key_blocks, reference=None):
+    """Index of the key each key block is measured from.
+
+    That is each block's own relative key, or the key named reference for all.
+    """
+    index_of = {key_block.name: index for index, key_block in enumerate(key_blocks)}
+    if reference is not None:
+        return np.full(len(key_blocks), index_of[reference], dtype=np.int64)
+    return np.array([index_of.get(key_block.relative_key.name, 0) for key_block in key_blocks], dtype=np.int64)
+
+
+def vertex_group_weights(obj, names):
+    """Per-vertex weight in each of the named vertex groups of obj.
+
+    Names without a matching group are left out; a shape key masked by such
+    a name acts on every vertex, as in Blender.
+    """
+    groups = {name: obj.vertex_groups[name].index for name in set(names) if name and name in obj.vertex_groups}
+    if not groups:
+        return {}
+    table = weight_table.read_vertex_weights(obj)
+    vertex_count = len(table.offsets) - 1
+    vertices = np.repeat(np.arange(vertex_count), np.diff(table.offsets))
+    weights = {}
+    for name, group in groups.items():
+        in_group = table.groups == group
+        weights[name] = np.zeros(vertex_count, dtype=np.float32)
+        weights[name][vertices[in_group]] = table.weights[in_group]
+    return weights
+
+
+def key_shapes(obj, keys, reference=None):
+    """Return (basis, shapes): the mesh with only each of keys at value 1.0.
+
+    As Blender evaluates it, a shape is Basis + (key - relative key) scaled by
+    the key's vertex group, or the Basis for a muted key. reference replaces
+    every key's relative key. Only the keys involved are read. Modifiers are
+    not applied. Absolute shape keys have no per-key shape and raise ValueError.
+    """
+    shape_keys = obj.data.shape_keys
+    if not shape_keys.use_relative:
+        raise ValueError(f"{obj.name} uses absolute shape keys, which cannot be exported per key")
+    key_blocks = shape_keys.key_blocks
+    references = reference_indices(key_blocks, reference)[keys].tolist()
+    needed = sorted({0, *keys, *references})
+    rows = {index: row for row, index in enumerate(needed)}
+    key_coords = read_key_coords(key_blocks, needed)
+    group_weights = vertex_group_weights(obj, [key_blocks[index].vertex_group for index in keys])
+
+    basis = key_coords[rows[0]]
+    shapes = []
+    for index, reference_index in zip(keys, references):
+        key_block = key_blocks[index]
+        weights = group_weights.get(key_block.vertex_group)
+        if key_block.mute:
+            shapes.append(basis)
+        elif reference_index == 0 and weights is None:
+            shapes.append(key_coords[rows[index]])
+        else:
+            offsets = key_coords[rows[index]] - key_coords[rows[reference_index]]
+            if weights is not None:
+                offsets *= weights[:, None]
+            shapes.append(basis + offsets)
+    return basis, shapes
+
+
+def export_name(obj):
+    """The "o" name export_scene.obj writes for an object."""
+    names = [name.replace(" ", "_") for name in (obj.name, obj.data.name)]
+    return names[0] if obj.name == obj.data.name else "_".join(names)
+
+
+def export_matrix(obj):
+    """Object-to-file matrix applied to every vertex, as export_scene.obj does."""
+    return AXIS_CONVERSION @ np.array(obj.matrix_world, dtype=np.float64)
+
+
+def build_face_block(mesh, flip=False):
+    """Format the "s" and "f" lines shared by every key's OBJ.
+
+    Faces keep the mesh's polygon order (keep_vertex_order). flip reverses the
+    winding after the first corner, as flip_normals() does for mirrored objects.
+    """
+    polygon_count = len(mesh.polygons)
+    loop_verts = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    loop_starts = np.empty(polygon_count, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    loop_totals = np.empty(polygon_count, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    use_smooth = np.empty(polygon_count, dtype=bool)
+    mesh.polygons.foreach_get("use_smooth", use_smooth)
+
+    face_offsets = np.zeros(polygon_count + 1, dtype=np.int64)
+    np.cumsum(loop_totals, out=face_offsets[1:])
+    face_of_corner = np.repeat(np.arange(polygon_count), loop_totals)
+    position = np.arange(face_offsets[-1]) - face_offsets[face_of_corner]
+    if flip:
+        position = np.where(position == 0, 0, loop_totals[face_of_corner] - position)
+    corners = loop_starts[face_of_corner] + position
+    lines = text_format.format_index_lines("f", face_offsets, loop_verts[corners] + 1).splitlines(True)
+
+    # export_scene.obj writes an "s" line before the first face and wherever smoothing changes
+    pieces = []
+    previous = 0
+    for face in np.flatnonzero(np.r_[True, use_smooth[1:] != use_smooth[:-1]])[:polygon_count].tolist():
+        pieces += lines[previous:face]
+        pieces.append("s 1\n" if use_smooth[face] else "s off\n")
+        previous = face
+    pieces += lines[previous:]
+    return "".join(pieces)
+
+
+def build_shape_key_obj(object_name, coords, matrix, face_block):
+    coords = coords @ matrix[:3, :3].T + matrix[:3, 3]
+    return "".join((
+        "# Blender OBJ File\n",
+        "# www.blender.org\n",
+        f"o {object_name}\n",
+        text_format.format_rows("v", coords),
+        face_block,
+    ))
+
+
+def write_shape_key_obj(path, object_name, coords, matrix, face_block):
+    with open(path, 'w') as file:
+        file.write(build_shape_key_obj(object_name, coords, matrix, face_block))
+
+
+def export_shape_keys(obj, export_dir, keys=None, reference=None, max_workers=None):
+    """Write <key name>.obj for the given shape keys of obj (default: all but the Basis).
+
+    Each file holds key_shapes' shape of that key. Coordinates come straight
+    from the key blocks, so key values, the scene and the depsgraph are left
+    untouched. Files are written from a thread pool. Returns the number of
+    files written.
+    """
+    key_blocks = obj.data.shape_keys.key_blocks
+    keys = list(range(1, len(key_blocks))) if keys is None else list(keys)
+    _basis, shapes = key_shapes(obj, keys, reference)
+    matrix = export_matrix(obj)
+    face_block = build_face_block(obj.data, flip=np.linalg.det(matrix[:3, :3]) < 0.0)
+    object_name = export_name(obj)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(write_shape_key_obj, os.path.join(export_dir, f"{key_blocks[index].name}.obj"),
+                        object_name, coords, matrix, face_block)
+            for index, coords in zip(keys, shapes)]
+        for future in futures:
+            future.result()
+    return len(keys)
+
+
+def deltas_path(export_dir, obj):
+    return os.path.join(export_dir, f"{obj.name}_deltas.bin")
+
+
+def export_shape_key_deltas(obj, export_dir, epsilon=1e-5, keys=None, reference=None):
+    """Write the given shape keys of obj (default: all but the Basis) into one sparse delta file.
+
+    Each key stores key_shapes' shape minus the Basis, in the mesh's local
+    space. Returns the path written.
+    """
+    key_blocks = obj.data.shape_keys.key_blocks
+    keys = list(range(1, len(key_blocks))) if keys is None else list(keys)
+    basis, shapes = key_shapes(obj, keys, reference)
+    offsets, vertices, deltas = shape_key_deltas.sparse_deltas(
+        np.array(shapes).reshape(len(keys), len(basis), 3), basis, epsilon)
+
+    path = deltas_path(export_dir, obj)
+    names = [key_blocks[index].name for index in keys]
+    shape_key_deltas.write_deltas(path, names, len(basis), offsets, vertices, deltas)
+    return path
+
+
+def read_obj_vertices(path):
+    """Return the "v" lines of an OBJ as a (vertices, 3) float64 array, ignoring everything else."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+
+    # Only vertex lines are kept; their numbers are converted in one go
+    values = b" ".join(line[2:] for line in raw.splitlines() if line.startswith((b"v ", b"v\t"))).split()
+    if len(values) % 3:
+        raise ValueError(f"{os.path.basename(path)}: vertex lines must have exactly 3 coordinates")
+    return np.array(values).astype(np.float64).reshape(-1, 3)
+
+
+def set_key_coords(obj, name, coords):
+    """Create or update shape key `name` of obj from coordinates in exported (OBJ) space.
+
+    coords is the evaluated shape, as export_shape_keys writes it. A key whose
+    relative key is not the Basis gets relative key + (coords - Basis), so it
+    evaluates to coords again. Vertex group weights are not divided out: a key
+    masked by a vertex group takes the masked shape as its full shape.
+    """
+    matrix = np.linalg.inv(export_matrix(obj))
+    local = (coords @ matrix[:3, :3].T + matrix[:3, 3]).astype(np.float32)
+
+    if obj.data.shape_keys is None:
+        obj.shape_key_add(name="Basis", from_mix=False)
+    key_blocks = obj.data.shape_keys.key_blocks
+    key_block = key_blocks.get(name)
+    if key_block is None:
+        key_block = obj.shape_key_add(name=name, from_mix=False)
+    elif key_block != key_blocks[0] and key_block.relative_key != key_blocks[0]:
+        basis, relative = read_key_coords(key_blocks, [0, key_blocks.find(key_block.relative_key.name)])
+        local = relative + (local - basis)
+    key_block.data.foreach_set("co", local.ravel())
@@ -0,0 +1,151 @@
+import numpy as np
+
+# Text is assembled as byte matrices: one row per token (or line piece) and a
+# keep mask that marks which bytes of each row are emitted. Concatenating
+# blocks side by side and reading the kept bytes in row-major order yields
+# the final text without formatting numbers one at a time in Python.
+
+_ZERO = ord("0")
+
+
+def _literal(text, rows, keep=None):
+    chars = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    chars = np.broadcast_to(chars, (rows, len(chars)))
+    if keep is None:
+        keep = np.ones(chars.shape, dtype=bool)
+    else:
+        keep = np.broadcast_to(keep[:, None], chars.shape)
+    return chars, keep
+
+
+def _strings(strings):
+    chars = np.array(strings, dtype=np.bytes_)
+    chars = chars.view(np.uint8).reshape(len(chars), chars.dtype.itemsize)
+    return chars, chars != 0
+
+
+def _digits(magnitude, width=None):
+    """Decimal digits of non-negative integers, right-aligned without leading zeros.
+
+    With a fixed width every row is zero-padded to exactly that many digits.
+    """
+    if width is None:
+        top = int(magnitude.max()) if len(magnitude) else 0
+        powers = 10 ** np.arange(len(str(top)) - 1, -1, -1, dtype=np.int64)
+        ndigits = 1 + (magnitude[:, None] >= powers[:-1]).sum(axis=1)
+        keep = np.arange(len(powers)) >= len(powers) - ndigits[:, None]
+    else:
+        powers = 10 ** np.arange(width - 1, -1, -1, dtype=np.int64)
+        keep = np.ones((len(magnitude), width), dtype=bool)
+    chars = (magnitude[:, None] // powers % 10 + _ZERO).astype(np.uint8)
+    return chars, keep
+
+
+def _hstack(*blocks):
+    chars = np.hstack([b[0] for b in blocks])
+    keep = np.hstack([b[1] for b in blocks])
+    return chars, keep
+
+
+def _join(chars, keep):
+    return chars[keep].tobytes().decode("ascii")
+
+
+def _int_tokens(values):
+    values = np.asarray(values, dtype=np.int64).ravel()
+    return _hstack(_literal("-", len(values), values < 0), _digits(np.abs(values)))
+
+
+def _float_tokens(values, precision):
+    """Tokens matching f"{value:.{precision}f}", or repr(value) when precision is None."""
+    values = np.asarray(values, dtype=np.float64).ravel()
+    if precision is None:
+        return _strings(list(map(repr, values.tolist())))
+
+    scale = 10 ** precision
+    scaled = np.abs(values) * scale
+    if len(values) and not (np.isfinite(scaled).all() and scaled.max() < 2.0 ** 62):
+        return _strings([f"{v:.{precision}f}" for v in values.tolist()])
+
+    # The scaled value is rounded once on multiplication (exactly, for float32
+    # input and precision <= 12). Values that land on a rounding tie are
+    # re-rounded by Python from their exact binary value.
+    rounded = np.rint(scaled)
+    ties = np.flatnonzero(np.abs(scaled - np.floor(scaled) - 0.5) <= np.spacing(scaled))
+    rounded = rounded.astype(np.int64)
+    for i in ties.tolist():
+        rounded[i] = int(f"{abs(values[i]):.{precision}f}".replace(".", ""))
+
+    whole, frac = np.divmod(rounded, scale)
+    blocks = [_literal("-", len(values), np.signbit(values)), _digits(whole)]
+    if precision:
+        blocks += [_literal(".", len(values)), _digits(frac, precision)]
+    return _hstack(*blocks)
+
+
+def _lines(offsets, tokens, head="", newline="\n"):
+    """Lay out CSR token rows as lines: head, the tokens of line i, newline."""
+    offsets = np.asarray(offsets, dtype=np.int64)
+    chars, keep = tokens
+    line_count = len(offsets) - 1
+    line_starts = offsets[:-1] + 2 * np.arange(line_count)
+    line_ends = offsets[1:] + 2 * np.arange(line_count) + 1
+    token_rows = np.arange(len(chars)) + 2 * np.repeat(np.arange(line_count), np.diff(offsets)) + 1
+
+    width = max(chars.shape[1], len(head), len(newline))
+    out_chars = np.zeros((len(chars) + 2 * line_count, width), dtype=np.uint8)
+    out_keep = np.zeros(out_chars.shape, dtype=bool)
+    out_chars[token_rows, :chars.shape[1]] = chars
+    out_keep[token_rows, :chars.shape[1]] = keep
+    for rows, text in ((line_starts, head), (line_ends, newline)):
+        text_chars, text_keep = _literal(text, len(rows))
+        out_chars[rows, :len(text)] = text_chars
+        out_keep[rows, :len(text)] = text_keep
+    return _join(out_chars, out_keep)
+
+
+def format_rows(prefix, values, precision=6, suffix="", newline="\n"):
+    """Format an (n, k) float array as "prefix v0 ... vk-1suffix" lines.
+
+    precision=None writes each value as repr() does.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    rows, columns = values.shape
+    if precision is None:
+        # repr() has no fixed layout, but one %-format over the whole array
+        # still runs entirely in C
+        line = prefix.replace("%", "%%") + " %r" * columns + suffix.replace("%", "%%") + newline
+        return (line * rows) % tuple(values.ravel().tolist())
+
+    blocks = [_literal(prefix, rows)]
+    for column in range(columns):
+        blocks += [_literal(" ", rows), _float_tokens(values[:, column], precision)]
+    blocks.append(_literal(suffix + newline, rows))
+    return _join(*_hstack(*blocks))
+
+
+def format_index_lines(prefix, offsets, indices, repeat=1, newline="\n"):
+    """Format CSR integer lists as "prefix i i ..." lines.
+
+    With repeat > 1 each index is written as i/i/..., as used by OBJ face corners.
+    """
+    indices = np.asarray(indices, dtype=np.int64)
+    index = _int_tokens(indices)
+    blocks = [_literal(" ", len(indices)), index]
+    for _ in range(repeat - 1):
+        blocks += [_literal("/", len(indices)), index]
+    return _lines(offsets, _hstack(*blocks), head=prefix, newline=newline)
+
+
+def format_weight_lines(offsets, ids, weights, precision=6, newline="\n"):
+    """Format CSR (id, weight) pairs as one "id weight id weight ..." line per row."""
+    offsets = np.asarray(offsets, dtype=np.int64)
+    first = np.zeros(len(ids), dtype=bool)
+    first[offsets[:-1][np.diff(offsets) > 0]] = True
+    tokens = _hstack(
+        _literal(" ", len(ids), ~first),
+        _int_tokens(ids),
+        _literal(" ", len(ids)),
+        _float_tokens(weights, precision),
+    )
+    return _lines(offsets, tokens, newline=newline)
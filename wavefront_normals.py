@@ -0,0 +1,161 @@
+import os
+import numpy as np
+from collections import namedtuple
+from . import mesh_binary
+from . import text_format
+
+# Flat copies of everything the normals exporter needs from an evaluated mesh.
+# Per-loop arrays are indexed by loop, polygons by loop_starts/loop_totals.
+MeshArrays = namedtuple("MeshArrays", ("coords", "loop_normals", "loop_uvs", "loop_verts", "loop_starts", "loop_totals"))
+
+
+def read_mesh_arrays(mesh):
+    """Copy a mesh's vertex, loop and polygon data with bulk foreach_get reads."""
+    vertex_count = len(mesh.vertices)
+    loop_count = len(mesh.loops)
+    polygon_count = len(mesh.polygons)
+
+    coords = np.empty(vertex_count * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    loop_normals = np.empty(loop_count * 3, dtype=np.float32)
+    mesh.loops.foreach_get("normal", loop_normals)
+    loop_verts = np.empty(loop_count, dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+
+    loop_uvs = np.zeros(loop_count * 2, dtype=np.float32)
+    if mesh.uv_layers.active is not None:
+        mesh.uv_layers.active.data.foreach_get("uv", loop_uvs)
+
+    loop_starts = np.empty(polygon_count, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    loop_totals = np.empty(polygon_count, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+
+    return MeshArrays(
+        coords.reshape(-1, 3), loop_normals.reshape(-1, 3), loop_uvs.reshape(-1, 2),
+        loop_verts, loop_starts, loop_totals)
+
+
+def snapshot_mesh(obj, depsgraph):
+    """Copy the arrays of obj's evaluated mesh, freeing the temporary mesh right away."""
+    obj_eval = obj.evaluated_get(depsgraph)
+    mesh_eval = obj_eval.to_mesh(preserve_all_data_layers=True, depsgraph=depsgraph)
+    try:
+        mesh_eval.calc_normals_split()
+        return read_mesh_arrays(mesh_eval)
+    finally:
+        obj_eval.to_mesh_clear()
+
+
+def last_loop_per_vertex(arrays):
+    """Index of the last loop using each vertex (-1 for loose vertices)."""
+    vertex_count = len(arrays.coords)
+    last = np.full(vertex_count, -1, dtype=np.int64)
+    reversed_verts, first_in_reversed = np.unique(arrays.loop_verts[::-1], return_index=True)
+    last[reversed_verts] = len(arrays.loop_verts) - 1 - first_in_reversed
+    return last
+
+
+def face_corners(arrays, reverse=False):
+    """Return (face offsets, loop indices) of all polygons, optionally with reversed winding."""
+    totals = arrays.loop_totals.astype(np.int64)
+    offsets = np.zeros(len(totals) + 1, dtype=np.int64)
+    np.cumsum(totals, out=offsets[1:])
+    within = np.arange(offsets[-1]) - np.repeat(offsets[:-1], totals)
+    if reverse:
+        within = np.repeat(totals, totals) - 1 - within
+    return offsets, np.repeat(arrays.loop_starts.astype(np.int64), totals) + within
+
+
+def split_vertices(arrays):
+    """Deduplicate loops on (vertex, normal, uv).
+
+    Returns the source loop of every split vertex and the split vertex of
+    every loop. Split vertices are ordered by original vertex, then first use.
+    """
+    keys = np.empty(len(arrays.loop_verts), dtype=[("vert", "<i4"), ("normal", "<f4", 3), ("uv", "<f4", 2)])
+    keys["vert"] = arrays.loop_verts
+    keys["normal"] = arrays.loop_normals
+    keys["uv"] = arrays.loop_uvs
+    _, first_loops, loop_keys = np.unique(keys.view(np.void(keys.dtype.itemsize)), return_index=True, return_inverse=True)
+
+    order = np.lexsort((first_loops, arrays.loop_verts[first_loops]))
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    return first_loops[order], rank[loop_keys.ravel()]
+
+
+def vertex_arrays(arrays, rotate_model=True, split=False):
+    """Return (coords, normals, uvs, face offsets, face vertex indices, remap) as written to the OBJ.
+
+    remap holds the source vertex of every split vertex (None unless split).
+    Without split, each vertex takes its normal and uv from the last loop using it.
+    """
+    if split:
+        source_loops, loop_targets = split_vertices(arrays)
+        remap = arrays.loop_verts[source_loops]
+        coords = arrays.coords[remap].astype(np.float64)
+        normals = arrays.loop_normals[source_loops].astype(np.float64)
+        uvs = arrays.loop_uvs[source_loops].astype(np.float64)
+    else:
+        last = last_loop_per_vertex(arrays)
+        used = last >= 0
+        remap = None
+        loop_targets = arrays.loop_verts
+        coords = arrays.coords.astype(np.float64)
+        normals = np.zeros(coords.shape)
+        normals[used] = arrays.loop_normals[last[used]]
+        uvs = np.zeros((len(coords), 2))
+        uvs[used] = arrays.loop_uvs[last[used]]
+
+    if rotate_model:
+        coords[:, 1:] *= -1
+        normals[:, :2] *= -1
+    else:
+        normals[:, ::2] *= -1
+
+    face_offsets, corners = face_corners(arrays, reverse=rotate_model)
+    return coords, normals, uvs, face_offsets, loop_targets[corners].astype(np.int64), remap
+
+
+def build_normals_obj(mesh_name, coords, normals, uvs, face_offsets, face_verts):
+    """Return the text of a _normals.obj with one v/vn/vt per vertex."""
+    return "".join((
+        "# Wavefront OBJ exported from Blender\n",
+        f"# Vertices: {len(coords)}\n",
+        f"# UVs: {len(coords)}\n",
+        f"# Normals: {len(coords)}\n",
+        text_format.format_rows("v", coords, precision=None),
+        text_format.format_rows("vn", normals, precision=None),
+        text_format.format_rows("vt", uvs, precision=None, suffix=" 0"),
+        f"g {mesh_name}\n",
+        "s 1\n",
+        text_format.format_index_lines("f", face_offsets, face_verts + 1, repeat=3),
+    ))
+
+
+def remap_path(path):
+    return os.path.splitext(path)[0] + "_remap.txt"
+
+
+def binary_path(path):
+    return os.path.splitext(path)[0] + ".bin"
+
+
+def write_normals_obj(path, mesh_name, arrays, rotate_model=True, split=False, binary=False):
+    """Write a _normals.obj.
+
+    In split mode a _remap.txt with the source vertex of each written vertex
+    goes alongside; with binary, a .bin dump of the same data (see mesh_binary).
+    """
+    coords, normals, uvs, face_offsets, face_verts, remap = vertex_arrays(arrays, rotate_model, split)
+    text = build_normals_obj(mesh_name, coords, normals, uvs, face_offsets, face_verts)
+    with open(path, 'w') as file:
+        file.write(text)
+
+    if remap is not None:
+        with open(remap_path(path), 'w') as file:
+            file.write(("%d\n" * len(remap)) % tuple(remap.tolist()))
+
+    if binary:
+        mesh_binary.write_mesh(binary_path(path), coords, normals, uvs, face_offsets, face_verts)
@@ -0,0 +1,111 @@
+import time
+import bpy
+from . import wavefront_normals
+
+DEBOUNCE_SECONDS = 0.5
+
+# The last normals export: object name -> (file path, mesh name) plus its options
+_last_export = {"files": {}, "rotate_model": True, "split_vertices": False, "write_binary": False}
+_dirty = set()
+_last_change = [0.0]
+
+
+def remember_export(files, rotate_model, split_vertices, write_binary):
+    _last_export["files"] = dict(files)
+    _last_export["rotate_model"] = rotate_model
+    _last_export["split_vertices"] = split_vertices
+    _last_export["write_binary"] = write_binary
+    _dirty.intersection_update(files)
+
+
+def is_running():
+    return _on_depsgraph_update in bpy.app.handlers.depsgraph_update_post
+
+
+def start():
+    if not is_running():
+        bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+
+
+def stop():
+    if is_running():
+        bpy.app.handlers.depsgraph_update_post.remove(_on_depsgraph_update)
+    if bpy.app.timers.is_registered(_flush):
+        bpy.app.timers.unregister(_flush)
+    _dirty.clear()
+
+
+def _on_depsgraph_update(scene, depsgraph):
+    files = _last_export["files"]
+    changed = False
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry:
+            continue
+        changed_id = update.id.original
+        if isinstance(changed_id, bpy.types.Object):
+            names = [changed_id.name] if changed_id.name in files else []
+        elif isinstance(changed_id, bpy.types.Mesh):
+            names = [name for name in files if getattr(bpy.data.objects.get(name), "data", None) == changed_id]
+        else:
+            continue
+        _dirty.update(names)
+        changed = changed or bool(names)
+
+    if changed:
+        _last_change[0] = time.monotonic()
+        if not bpy.app.timers.is_registered(_flush):
+            bpy.app.timers.register(_flush, first_interval=DEBOUNCE_SECONDS)
+
+
+def _flush():
+    """Timer: once edits have settled, re-export only the meshes that changed."""
+    wait = DEBOUNCE_SECONDS - (time.monotonic() - _last_change[0])
+    if wait > 0.0:
+        return wait
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    for name in sorted(_dirty):
+        obj = bpy.data.objects.get(name)
+        if obj is None or obj.type != 'MESH':
+            continue
+        file_path, mesh_name = _last_export["files"][name]
+        try:
+            arrays = wavefront_normals.snapshot_mesh(obj, depsgraph)
+            wavefront_normals.write_normals_obj(
+                file_path, mesh_name, arrays,
+                _last_export["rotate_model"], _last_export["split_vertices"], _last_export["write_binary"])
+            print(f"Live normals export: {file_path}")
+        except Exception as e:
+            print(f"Live normals export failed for {name}: {e}")
+    _dirty.clear()
+    return None
+
+
+class ToggleLiveNormalsExportOperator(bpy.types.Operator):
+    """Start or stop re-exporting the last exported meshes whenever their geometry changes"""
+    bl_idname = "export.wavefront_normals_live"
+    bl_label = "Toggle Live Normals Export"
+
+    def execute(self, context):
+        if is_running():
+            stop()
+            self.report({'INFO'}, "Live normals export stopped.")
+            return {'FINISHED'}
+
+        if not _last_export["files"]:
+            self.report({'ERROR'}, "Run Export Wavefront Normals once to choose the meshes and folder.")
+            return {'CANCELLED'}
+
+        start()
+        self.report({'INFO'}, f"Live normals export started for {len(_last_export['files'])} meshes.")
+        return {'FINISHED'}
+
+def register():
+    bpy.utils.register_class(ToggleLiveNormalsExportOperator)
+
+def unregister():
+    stop()
+    bpy.utils.unregister_class(ToggleLiveNormalsExportOperator)
+
+if __name__ == "__main__":
+    register()
@@ -0,0 +1,71 @@
+"""Binary Object{idx}.bin weight files.
+
+Only depends on NumPy, so conversion tools can use this file on its own.
+
+Layout (little-endian):
+    header   magic b"TKNW", uint16 version, uint16 weight encoding,
+             uint32 vertex count V, uint32 entry count E
+    offsets  uint32[V + 1]  influences of vertex i are entries offsets[i]:offsets[i + 1]
+    bone_ids uint16[E]
+    padding  to a 4 byte boundary
+    weights  float32[E] (encoding 0) or uint16[E] quantized as weight * 65535 (encoding 1)
+"""
+import struct
+from collections import namedtuple
+import numpy as np
+
+MAGIC = b"TKNW"
+VERSION = 1
+FLOAT32 = 0
+QUANTIZED_UINT16 = 1
+
+_HEADER = struct.Struct("<4sHHII")
+
+BinaryWeights = namedtuple("BinaryWeights", ("offsets", "bone_ids", "weights", "weight_scale"))
+
+
+def _align4(size):
+    return (size + 3) & ~3
+
+
+def write_weights(path, offsets, bone_ids, weights, quantize=False):
+    offsets = np.asarray(offsets)
+    bone_ids = np.asarray(bone_ids)
+    weights = np.asarray(weights, dtype=np.float32)
+    if len(bone_ids) and (bone_ids.min() < 0 or bone_ids.max() > 0xFFFF):
+        raise ValueError("bone IDs must fit in uint16")
+
+    if quantize:
+        weights = np.rint(np.clip(weights, 0.0, 1.0) * 65535.0).astype("<u2")
+    else:
+        weights = weights.astype("<f4")
+
+    ids_end = _HEADER.size + 4 * len(offsets) + 2 * len(bone_ids)
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, QUANTIZED_UINT16 if quantize else FLOAT32, len(offsets) - 1, len(bone_ids)))
+        f.write(offsets.astype("<u4").tobytes())
+        f.write(bone_ids.astype("<u2").tobytes())
+        f.write(bytes(_align4(ids_end) - ids_end))
+        f.write(weights.tobytes())
+
+
+def read_weights(path):
+    """Memory-map a weight file and return zero-copy views of its arrays.
+
+    Quantized weights are returned as the stored uint16 values; multiply by
+    weight_scale to get floats.
+    """
+    data = np.memmap(path, dtype=np.uint8, mode='r')
+    magic, version, encoding, vertex_count, entry_count = _HEADER.unpack(data[:_HEADER.size].tobytes())
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{path} is not a version {VERSION} TKNW weight file")
+
+    offsets_start = _HEADER.size
+    ids_start = offsets_start + 4 * (vertex_count + 1)
+    weights_start = _align4(ids_start + 2 * entry_count)
+    weight_size = 4 if encoding == FLOAT32 else 2
+
+    offsets = data[offsets_start:ids_start].view("<u4")
+    bone_ids = data[ids_start:ids_start + 2 * entry_count].view("<u2")
+    weights = data[weights_start:weights_start + weight_size * entry_count].view("<f4" if encoding == FLOAT32 else "<u2")
+    return BinaryWeights(offsets, bone_ids, weights, 1.0 if encoding == FLOAT32 else 1.0 / 65535.0)
@@ -0,0 +1,155 @@
+import os
+import bpy
+from . import weight_files
+from . import weight_table
+from . import worker_pool
+
+
+class WeightExportOptions:
+    """Options shared by every Object{idx}.txt weight exporter"""
+
+    use_parallel: bpy.props.BoolProperty(
+        name="Parallel Export",
+        description="Format and write the weight files in worker processes, one per CPU core",
+        default=False,
+    )
+
+    output_format: bpy.props.EnumProperty(
+        name="Format",
+        description="File format of the exported weights",
+        items=[
+            ('TEXT', "Text", "Object{idx}.txt with 'id weight' pairs per vertex line"),
+            ('BINARY', "Binary", "Object{idx}.bin with uint16 bone IDs and float32 weights"),
+            ('BINARY_QUANTIZED', "Binary (Quantized)", "Object{idx}.bin with uint16 bone IDs and uint16 weights"),
+        ],
+        default='TEXT',
+    )
+
+    weight_precision: bpy.props.IntProperty(
+        name="Weight Precision",
+        description="Decimal places written for each weight",
+        default=6,
+        min=1,
+        max=9,
+    )
+
+    max_influences: bpy.props.IntProperty(
+        name="Max Influences",
+        description="Keep only the strongest weights of each vertex (0 = no limit, 7 for the Cena/Austin/Charlotte rigs)",
+        default=0,
+        min=0,
+    )
+
+    min_weight: bpy.props.FloatProperty(
+        name="Min Weight",
+        description="Drop weights below this value",
+        default=0.0,
+        min=0.0,
+        max=1.0,
+        precision=4,
+    )
+
+    normalize_weights: bpy.props.BoolProperty(
+        name="Normalize",
+        description="Rescale each vertex's exported weights to sum to 1",
+        default=False,
+    )
+
+    skip_unchanged: bpy.props.BoolProperty(
+        name="Skip Unchanged",
+        description="Keep a manifest of content hashes in the export folder and only rewrite files whose weights changed",
+        default=True,
+    )
+
+
+def export_weight_files(operator, meshes, export_dir, bone_map):
+    """Write Object{idx} weight files for each mesh, numbered in selection order."""
+    export_rig_weight_files(operator, meshes, [(export_dir, bone_map)])
+
+
+def export_rig_weight_files(operator, meshes, rigs):
+    """Write Object{idx} weight files for each mesh into every (export_dir, bone_map) of rigs.
+
+    Each mesh's weights are read once and then remapped for every rig.
+    """
+    manifests = {}
+    if operator.skip_unchanged:
+        manifests = {export_dir: weight_files.load_manifest(export_dir) for export_dir, _bone_map in rigs}
+    reports = {export_dir: {} for export_dir, _bone_map in rigs}
+    pending = []
+    up_to_date = []
+
+    for idx, obj in enumerate(meshes):
+        try:
+            # Weights are always snapshotted here on the main thread;
+            # workers only ever see the extracted arrays
+            vertex_weights = weight_table.read_vertex_weights(obj)
+        except Exception as e:
+            operator.report({'ERROR'}, f"Failed to export {obj.name}: {e}")
+            continue
+
+        for export_dir, bone_map in rigs:
+            file_name = f"Object{idx}{weight_files.FORMAT_EXTENSIONS[operator.output_format]}"
+            file_path = os.path.join(export_dir, file_name)
+            label = obj.name if len(rigs) == 1 else f"{os.path.basename(os.path.normpath(export_dir))}/{obj.name}"
+            try:
+                lookup = weight_table.compile_bone_lookup(obj, bone_map)
+                table = weight_table.remap_groups(vertex_weights, lookup)
+                table = weight_table.limit_influences(
+                    table, operator.max_influences, operator.min_weight, operator.normalize_weights)
+                stats = weight_table.dropped_weight_stats(obj, vertex_weights, lookup, table)
+                reports[export_dir][file_name] = dict(stats, object=obj.name, label=label)
+
+                digest = None
+                if operator.skip_unchanged:
+                    digest = weight_table.table_digest(
+                        table, bone_map, operator.output_format, operator.weight_precision)
+                    if weight_files.is_up_to_date(manifests[export_dir], file_path, digest):
+                        up_to_date.append(label)
+                        continue
+
+                args = (file_path, table, operator.output_format, operator.weight_precision)
+                pending.append((label, export_dir, args, digest))
+            except Exception as e:
+                operator.report({'ERROR'}, f"Failed to export {label}: {e}")
+
+    outcomes = worker_pool.run_jobs(weight_files.write_weight_file, [job[2] for job in pending], operator.use_parallel)
+    for (label, export_dir, args, digest), outcome in zip(pending, outcomes):
+        if isinstance(outcome, Exception):
+            operator.report({'ERROR'}, f"Failed to export {label}: {outcome}")
+        elif export_dir in manifests:
+            manifests[export_dir][os.path.basename(args[0])] = weight_files.manifest_entry(args[0], digest)
+    for export_dir, manifest in manifests.items():
+        try:
+            weight_files.save_manifest(export_dir, manifest)
+        except OSError as e:
+            operator.report({'WARNING'}, f"Could not save {weight_files.MANIFEST_NAME}: {e}")
+    if up_to_date:
+        operator.report({'INFO'}, f"Up to date, skipped: {', '.join(up_to_date)}")
+
+    report_weight_losses(operator, reports)
+
+
+def report_weight_losses(operator, reports):
+    """Save each folder's weights_report.json and summarize dropped weights on the operator."""
+    lossy = []
+    dropped_weight = 0.0
+    empty_vertices = 0
+    for export_dir, report in reports.items():
+        for stats in report.values():
+            label = stats.pop("label")
+            if stats["dropped_groups"] or stats["empty_vertices"]:
+                lossy.append(label)
+                dropped_weight += stats["dropped_weight"]
+                empty_vertices += stats["empty_vertices"]
+        try:
+            weight_files.save_report(export_dir, report)
+        except OSError as e:
+            operator.report({'WARNING'}, f"Could not save {weight_files.REPORT_NAME}: {e}")
+
+    if lossy:
+        names = ", ".join(lossy[:5]) + (", ..." if len(lossy) > 5 else "")
+        operator.report(
+            {'WARNING'},
+            f"{len(lossy)} objects lost weights ({dropped_weight:.3f} dropped, {empty_vertices} vertices "
+            f"without influences) on {names}; see {weight_files.REPORT_NAME}")
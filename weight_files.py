@@ -0,0 +1,106 @@
+import json
+import os
+import numpy as np
+from . import text_format
+from . import weight_binary
+from .weight_table import WeightTable
+
+MANIFEST_NAME = "weights_manifest.json"
+REPORT_NAME = "weights_report.json"
+
+# output format -> file extension
+FORMAT_EXTENSIONS = {
+    'TEXT': ".txt",
+    'BINARY': ".bin",
+    'BINARY_QUANTIZED': ".bin",
+}
+
+
+def write_weight_text(path, table, precision=6):
+    """Write a bone-ID WeightTable as one "id weight id weight ..." line per vertex."""
+    text = text_format.format_weight_lines(table.offsets, table.groups, table.weights, precision)
+    with open(path, 'w') as out:
+        out.write(text)
+
+
+def write_weight_file(path, table, output_format='TEXT', precision=6):
+    if output_format == 'TEXT':
+        write_weight_text(path, table, precision)
+    else:
+        weight_binary.write_weights(
+            path, table.offsets, table.groups, table.weights, quantize=output_format == 'BINARY_QUANTIZED')
+
+
+def read_weight_file(path):
+    """Read a text or binary weight file into a bone-ID WeightTable."""
+    if not path.lower().endswith(".bin"):
+        return read_weight_text(path)
+    weights = weight_binary.read_weights(path)
+    return WeightTable(
+        weights.offsets.astype(np.int64),
+        weights.bone_ids.astype(np.int32),
+        (weights.weights * np.float32(weights.weight_scale)).astype(np.float32),
+    )
+
+
+def read_weight_text(path):
+    """Parse an Object{idx}.txt file back into a bone-ID WeightTable."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+
+    # Count the tokens on every line from byte classes, then convert all tokens at once
+    data = np.frombuffer(raw, dtype=np.uint8)
+    is_newline = data == ord("\n")
+    is_blank = is_newline | (data == ord(" ")) | (data == ord("\t")) | (data == ord("\r"))
+    token_start = ~is_blank
+    token_start[1:] &= is_blank[:-1]
+    starts_before = np.zeros(len(data) + 1, dtype=np.int64)
+    np.cumsum(token_start, out=starts_before[1:])
+
+    line_ends = np.flatnonzero(is_newline)
+    if len(data) and not is_newline[-1]:
+        line_ends = np.append(line_ends, len(data))
+    token_counts = np.diff(starts_before[line_ends], prepend=0)
+    if np.any(token_counts % 2):
+        line = int(np.flatnonzero(token_counts % 2)[0]) + 1
+        raise ValueError(f"{os.path.basename(path)} line {line}: expected 'id weight' pairs")
+
+    tokens = np.array(raw.split())
+    offsets = np.zeros(len(line_ends) + 1, dtype=np.int64)
+    np.cumsum(token_counts // 2, out=offsets[1:])
+    return WeightTable(offsets, tokens[0::2].astype(np.int32), tokens[1::2].astype(np.float32))
+
+
+def load_manifest(export_dir):
+    try:
+        with open(os.path.join(export_dir, MANIFEST_NAME), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(export_dir, manifest):
+    with open(os.path.join(export_dir, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+
+def manifest_entry(path, digest):
+    stat = os.stat(path)
+    return {"hash": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def is_up_to_date(manifest, path, digest):
+    """True if path was written from content with this digest and is untouched since."""
+    entry = manifest.get(os.path.basename(path))
+    if not entry or entry.get("hash") != digest:
+        return False
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return False
+    return stat.st_size == entry.get("size") and stat.st_mtime_ns == entry.get("mtime_ns")
+
+
+def save_report(export_dir, report):
+    with open(os.path.join(export_dir, REPORT_NAME), 'w') as f:
+        json.dump(report, f, indent=2, sort_keys=True)
@@ -0,0 +1,176 @@
+import hashlib
+import numpy as np
+from collections import namedtuple
+
+# Compressed sparse row layout of a mesh's deform weights: the influences of
+# vertex i are groups[offsets[i]:offsets[i + 1]] / weights[offsets[i]:offsets[i + 1]]
+WeightTable = namedtuple("WeightTable", ("offsets", "groups", "weights"))
+
+# (object pointer, id of bone map) -> (vertex group names, lookup array)
+_lookup_cache = {}
+
+
+def read_vertex_weights(obj):
+    """Read every vertex group assignment of a mesh object into a WeightTable."""
+    vertices = obj.data.vertices
+    counts = np.fromiter((len(v.groups) for v in vertices), dtype=np.int64, count=len(vertices))
+
+    offsets = np.zeros(len(vertices) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    groups = np.empty(offsets[-1], dtype=np.int32)
+    weights = np.empty(offsets[-1], dtype=np.float32)
+
+    # RNA has no whole-mesh accessor for deform weights, so pull each vertex's
+    # assignments with two foreach_get calls straight into the flat arrays
+    bounds = offsets.tolist()
+    for v, start, end in zip(vertices, bounds, bounds[1:]):
+        if start != end:
+            v.groups.foreach_get("group", groups[start:end])
+            v.groups.foreach_get("weight", weights[start:end])
+
+    return WeightTable(offsets, groups, weights)
+
+
+def _select(table, keep):
+    kept_before = np.zeros(len(keep) + 1, dtype=np.int64)
+    np.cumsum(keep, out=kept_before[1:])
+    return WeightTable(kept_before[table.offsets], table.groups[keep], table.weights[keep])
+
+
+def _entry_vertices(table):
+    return np.repeat(np.arange(len(table.offsets) - 1), np.diff(table.offsets))
+
+
+def remap_groups(table, lookup):
+    """Translate group indices through lookup, dropping entries that map to -1."""
+    ids = lookup[table.groups]
+    return _select(WeightTable(table.offsets, ids, table.weights), ids >= 0)
+
+
+def limit_influences(table, max_influences=0, min_weight=0.0, normalize=False):
+    """Clean up a WeightTable the way Blender's Clean/Limit Total/Normalize would.
+
+    Drops weights below min_weight, keeps only the max_influences strongest
+    weights of each vertex (0 = no limit) and optionally rescales each vertex
+    to sum to 1. Surviving entries keep their original order.
+    """
+    if min_weight > 0.0:
+        table = _select(table, table.weights >= min_weight)
+
+    if max_influences > 0 and np.diff(table.offsets).max(initial=0) > max_influences:
+        vertices = _entry_vertices(table)
+        order = np.lexsort((-table.weights, vertices))
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order)) - table.offsets[vertices[order]]
+        table = _select(table, rank < max_influences)
+
+    if normalize:
+        vertices = _entry_vertices(table)
+        totals = np.bincount(vertices, table.weights.astype(np.float64), minlength=len(table.offsets) - 1)
+        totals[totals == 0.0] = 1.0
+        weights = (table.weights / totals[vertices]).astype(np.float32)
+        table = WeightTable(table.offsets, table.groups, weights)
+
+    return table
+
+
+def compile_bone_lookup(obj, bone_map):
+    """Return obj's vertex-group-index -> bone-ID array for bone_map (-1 = unmapped).
+
+    The array is cached per object and rig map, and rebuilt whenever the
+    object's vertex groups are added, removed, reordered or renamed.
+    """
+    names = tuple(obj.vertex_groups.keys())
+    key = (obj.as_pointer(), id(bone_map))
+    cached = _lookup_cache.get(key)
+    if cached is None or cached[0] != names:
+        lookup = np.array([bone_map.get(name, -1) for name in names], dtype=np.int32)
+        lookup.flags.writeable = False
+        cached = _lookup_cache[key] = (names, lookup)
+    return cached[1]
+
+
+def clear_lookup_cache():
+    _lookup_cache.clear()
+
+
+def read_bone_weights(obj, bone_map):
+    """Read a mesh object's weights with vertex groups translated to bone IDs."""
+    return remap_groups(read_vertex_weights(obj), compile_bone_lookup(obj, bone_map))
+
+
+def table_digest(table, bone_map, *settings):
+    """Content hash of an export: the weight table, the rig map and any output settings."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(sorted(bone_map.items())).encode())
+    digest.update(repr(settings).encode())
+    for array in table:
+        digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest()
+
+
+def group_weight_totals(obj, table=None):
+    """Total weight carried by each vertex group of obj, keyed by group name."""
+    if table is None:
+        table = read_vertex_weights(obj)
+    names = obj.vertex_groups.keys()
+    totals = np.bincount(table.groups, table.weights, minlength=len(names))
+    return dict(zip(names, totals.tolist()))
+
+
+def score_bone_map(group_totals, bone_map):
+    """Return (dropped weight share, dropped group names) of exporting with bone_map."""
+    total = sum(group_totals.values())
+    dropped_groups = sorted(name for name in group_totals.keys() - bone_map.keys() if group_totals[name] > 0.0)
+    dropped = sum(group_totals[name] for name in dropped_groups)
+    return (dropped / total if total else 0.0), dropped_groups
+
+
+def dropped_weight_stats(obj, vertex_weights, lookup, table):
+    """Summarize what mapping vertex_weights through lookup (giving table) left out."""
+    dropped = lookup[vertex_weights.groups] < 0
+    dropped_groups = vertex_weights.groups[dropped]
+    group_weights = np.bincount(dropped_groups, vertex_weights.weights[dropped], minlength=len(lookup))
+    names = obj.vertex_groups.keys()
+    counts = np.diff(table.offsets)
+    return {
+        "vertices": len(counts),
+        "dropped_groups": {names[i]: group_weights[i] for i in np.unique(dropped_groups).tolist()},
+        "dropped_weight": float(group_weights.sum()),
+        "empty_vertices": int(np.count_nonzero(counts == 0)),
+        "max_influences": int(counts.max(initial=0)),
+    }
+
+
+def weight_runs(table):
+    """Yield (id, weight, vertex indices) once for every distinct (id, weight) pair in table."""
+    vertices = _entry_vertices(table)
+    order = np.lexsort((table.weights, table.groups))
+    ids = table.groups[order]
+    weights = table.weights[order]
+    vertices = vertices[order]
+    bounds = np.flatnonzero((ids[1:] != ids[:-1]) | (weights[1:] != weights[:-1])) + 1
+    bounds = [0] + bounds.tolist() + [len(order)]
+    for start, end in zip(bounds, bounds[1:]):
+        if start != end:
+            yield int(ids[start]), float(weights[start]), vertices[start:end].tolist()
+
+
+def write_vertex_weights(obj, table, names, replace=True):
+    """Assign a WeightTable to obj's vertex groups, looking up group names as names[table id].
+
+    Vertices that share the same weight in a group are added with a single
+    VertexGroup.add call. With replace, existing weights of those groups are
+    cleared first.
+    """
+    all_vertices = list(range(len(obj.data.vertices)))
+    vertex_groups = {}
+    for group, weight, vertices in weight_runs(table):
+        vg = vertex_groups.get(group)
+        if vg is None:
+            name = names[group]
+            vg = obj.vertex_groups.get(name) or obj.vertex_groups.new(name=name)
+            if replace:
+                vg.remove(all_vertices)
+            vertex_groups[group] = vg
+        vg.add(vertices, weight, 'REPLACE')
@@ -0,0 +1,78 @@
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Spawned workers are plain Python interpreters without bpy. Importing one of
+# the add-on's modules there would first run the add-on's __init__ (and its
+# `import bpy`), so every worker starts by registering bare package modules
+# that only carry the search path of the real packages.
+_REGISTER_PACKAGES = (
+    "import sys, types\n"
+    "for name, path in packages:\n"
+    "    if name not in sys.modules:\n"
+    "        module = types.ModuleType(name)\n"
+    "        module.__path__ = path\n"
+    "        sys.modules[name] = module\n"
+)
+
+
+def _package_paths():
+    parts = __package__.split(".")
+    names = [".".join(parts[:i]) for i in range(1, len(parts) + 1)]
+    return [(name, list(sys.modules[name].__path__)) for name in names]
+
+
+def process_pool(job_count):
+    """Return a process pool able to run the add-on's bpy-free functions.
+
+    Only modules that do not import bpy (weight_table, weight_files, ...)
+    may be used by the submitted callables and their arguments.
+    """
+    max_workers = max(1, min(job_count, os.cpu_count() or 1))
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=exec,
+        initargs=(_REGISTER_PACKAGES, {"packages": _package_paths()}),
+    )
+
+
+def _call(func, args):
+    try:
+        return func(*args)
+    except Exception as e:
+        return e
+
+
+def run_jobs(func, jobs, parallel=True):
+    """Call func(*args) for every args tuple in jobs and return the outcomes in job order.
+
+    With parallel and more than one job the calls run in a process pool, so
+    func and its arguments must be bpy-free. A job that raises returns its
+    exception as the outcome without stopping the others.
+    """
+    jobs = list(jobs)
+    if not parallel or len(jobs) < 2:
+        return [_call(func, args) for args in jobs]
+
+    outcomes = []
+    with process_pool(len(jobs)) as pool:
+        futures = []
+        for args in jobs:
+            try:
+                futures.append(pool.submit(func, *args))
+            except BrokenProcessPool:
+                futures.append(None)
+        for args, future in zip(jobs, futures):
+            try:
+                if future is None:
+                    raise BrokenProcessPool
+                outcomes.append(future.result())
+            except BrokenProcessPool:
+                # Worker processes could not start (or died), run the job here instead
+                outcomes.append(_call(func, args))
+            except Exception as e:
+                outcomes.append(e)
+    return outcomes